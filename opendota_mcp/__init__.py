@@ -3,9 +3,12 @@ OpenDota MCP Server Package
 """
 __version__ = "1.0.0"
 
-try:
-    from .server import main, mcp
-    __all__ = ["main", "mcp"]
-except ImportError as e:
-    print(f"Warning: Could not import server components: {e}")
-    __all__ = []
\ No newline at end of file
+__all__ = ["main", "mcp"]
+
+
+def __getattr__(name):
+    # Import the server lazily so `python -m opendota_mcp.server` executes it only once
+    if name in __all__:
+        from . import server
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
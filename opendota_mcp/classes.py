@@ -1,14 +1,17 @@
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, ClassVar
 import asyncio
-from datetime import datetime, timedelta, timezone
+import functools
+import threading
+from datetime import datetime, timezone
 import logging
+import re
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 
 logger = logging.getLogger("opendota-server")
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     account_id: int
     personaname: Optional[str] = None
@@ -29,100 +32,137 @@ class Player:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Player to dictionary, removing None values"""
-        data = asdict(self)
-        # Add computed win_rate property
+        # Read fields straight off the slots: asdict() would deep-copy every fav_heroes entry
+        data = {name: getattr(self, name) for name in self.__slots__}
         data['win_rate'] = self.win_rate
         return {k: v for k, v in data.items() if v is not None}
 
 # Rate limiter configuration
 class RateLimiter:
     """
-    Simple rate limiter for OpenDota API.
+    Sliding-window rate limiter for OpenDota API.
     OpenDota has rate limits: 60 requests per minute for anonymous users.
+    At most requests_per_minute calls are admitted in any rolling 60 seconds,
+    timed with time.monotonic() so it is immune to wall-clock jumps.
     """
-    def __init__(self, requests_per_minute: int = 50):
+    def __init__(self, requests_per_minute: int = 50, clock=time.monotonic, sleep=asyncio.sleep):
         """
         Args:
             requests_per_minute: Maximum requests allowed per minute (default 50 to be safe)
+            clock: Monotonic time source in seconds
+            sleep: Coroutine function used to wait for the window to free up
         """
         self.requests_per_minute = requests_per_minute
-        self.requests = []
+        self.clock = clock
+        self.sleep = sleep
+        self.requests: deque = deque()
         self.lock = asyncio.Lock()
     
     async def acquire(self):
         """Wait if necessary to respect rate limits."""
-        async with self.lock:
-            now = datetime.now()
-            # Remove requests older than 1 minute
-            self.requests = [req_time for req_time in self.requests 
-                           if now - req_time < timedelta(minutes=1)]
-            
-            if len(self.requests) >= self.requests_per_minute:
-                # Calculate wait time
-                oldest_request = self.requests[0]
-                wait_time = 60 - (now - oldest_request).total_seconds()
-                if wait_time > 0:
-                    logger.warning(f"Rate limit reached. Waiting {wait_time:.2f} seconds...")
-                    await asyncio.sleep(wait_time)
-                    # Clean up again after waiting
-                    now = datetime.now()
-                    self.requests = [req_time for req_time in self.requests 
-                                   if now - req_time < timedelta(minutes=1)]
-            
-            # Add current request
-            self.requests.append(now)
+        while True:
+            async with self.lock:
+                now = self.clock()
+                # Remove requests older than 1 minute (oldest are on the left)
+                while self.requests and now - self.requests[0] >= 60:
+                    self.requests.popleft()
+
+                if len(self.requests) < self.requests_per_minute:
+                    # Add current request
+                    self.requests.append(now)
+                    return
+
+                # Time until the oldest request leaves the window
+                wait_time = 60 - (now - self.requests[0])
+
+            # Sleep outside the lock so other callers are not serialized behind us
+            logger.warning("Rate limit reached. Waiting %.2f seconds...", wait_time)
+            await self.sleep(wait_time)
 
 # Server Metrics for server.py
 class ServerMetrics:
     """Simple in-memory metrics for debugging"""
     def __init__(self):
         self.start_time = time.time()
-        self.request_count = 0
+        # Uptime is measured on the monotonic clock so wall-clock adjustments can't skew it
+        self._start_monotonic = time.monotonic()
+        # Incremented under a lock so concurrent threads never lose or reorder a count
+        self._request_count = 0
+        self._request_lock = threading.Lock()
         self.tool_calls = defaultdict(int)
-        self.errors = []
-        self.last_requests = []
+        # Bounded ring buffers: appending past maxlen drops the oldest entry in O(1)
+        self.errors: deque = deque(maxlen=100)
+        self.last_requests: deque = deque(maxlen=50)
         self.active_connections = 0
+        # (epoch seconds, ISO string) reused for events within the same millisecond
+        self._cached_ts: Optional[Tuple[float, str]] = None
+
+    def _now_iso(self) -> str:
+        """Current UTC time as ISO string, cached per millisecond"""
+        t = time.time()
+        cached = self._cached_ts
+        if cached is not None and 0 <= t - cached[0] < 0.001:
+            return cached[1]
+        iso = datetime.fromtimestamp(t, timezone.utc).isoformat()
+        self._cached_ts = (t, iso)
+        return iso
         
+    @property
+    def request_count(self) -> int:
+        """Total requests recorded so far"""
+        return self._request_count
+
     def record_request(self, method: str, path: str):
-        self.request_count += 1
+        with self._request_lock:
+            self._request_count += 1
         self.last_requests.append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now_iso(),
             "method": method,
             "path": path
         })
-        # Keep only last 50 requests
-        if len(self.last_requests) > 50:
-            self.last_requests.pop(0)
     
     def record_tool_call(self, tool_name: str):
         self.tool_calls[tool_name] += 1
     
     def record_error(self, error: str, context: str = None):
         self.errors.append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now_iso(),
             "error": str(error),
             "context": context
         })
-        # Keep only last 100 errors
-        if len(self.errors) > 100:
-            self.errors.pop(0)
 
     @property
     def uptime(self) -> float:
         """Get server uptime in seconds"""
-        return time.time() - self.start_time
+        return time.monotonic() - self._start_monotonic
 
     def to_dict(self):
         return {
             "uptime_seconds": round(self.uptime, 2),
             "total_requests": self.request_count,
             "tool_calls": dict(self.tool_calls),
-            "recent_errors": self.errors[-10:],  # Last 10 errors
-            "last_requests": self.last_requests[-10:],  # Last 10 requests
+            "recent_errors": list(self.errors)[-10:],  # Last 10 errors
+            "last_requests": list(self.last_requests)[-10:],  # Last 10 requests
             "active_connections": self.active_connections
         }
 
 
+@functools.lru_cache(maxsize=8192)
+def _format_seconds(seconds: int) -> str:
+    """Format seconds as M:SS (match times are bounded, so results are cached)."""
+    mins, secs = divmod(seconds, 60)
+    return f"{mins}:{secs:02d}"
+
+
+@functools.lru_cache(maxsize=256)
+def _unit_to_display(unit: str) -> str:
+    """Convert a unit name (e.g. "npc_dota_hero_shadow_shaman") to a display name."""
+    if "npc_dota_hero_" in unit:
+        hero_internal = unit.replace("npc_dota_hero_", "")
+        return " ".join(w.capitalize() for w in hero_internal.split("_"))
+    return "Creeps" if any(x in unit for x in ["creep", "siege"]) else "Unknown"
+
+
 class ObjectiveProcessor:
     """Processes match objectives into human-readable format."""
 
@@ -134,35 +174,62 @@ class ObjectiveProcessor:
 
     LANE_PATTERNS = [("_bot", "Bot"), ("_mid", "Mid"), ("_top", "Top")]
 
+    # Compiled once: a single regex search replaces a substring scan per pattern
+    _BUILDING_RE = re.compile("|".join(re.escape(pattern) for pattern, _ in BUILDING_PATTERNS))
+    _BUILDING_NAMES = dict(BUILDING_PATTERNS)
+    _LANE_RE = re.compile("|".join(re.escape(pattern) for pattern, _ in LANE_PATTERNS))
+    _LANE_NAMES = dict(LANE_PATTERNS)
+
+    # Map objective types to handler method names (shared by all instances)
+    HANDLERS: ClassVar[Dict[str, str]] = {
+        "CHAT_MESSAGE_FIRSTBLOOD": "_handle_firstblood",
+        "CHAT_MESSAGE_COURIER_LOST": "_handle_courier",
+        "building_kill": "_handle_building",
+        "CHAT_MESSAGE_MINIBOSS_KILL": "_handle_tormentor",
+        "CHAT_MESSAGE_ROSHAN_KILL": "_handle_roshan",
+        "CHAT_MESSAGE_AEGIS": "_handle_aegis",
+    }
+
     def __init__(self, slot_to_hero: Dict[int, str]):
         self.slot_to_hero = slot_to_hero
-        # Map objective types to handler methods
-        self.handlers = {
-            "CHAT_MESSAGE_FIRSTBLOOD": self._handle_firstblood,
-            "CHAT_MESSAGE_COURIER_LOST": self._handle_courier,
-            "building_kill": self._handle_building,
-            "CHAT_MESSAGE_MINIBOSS_KILL": self._handle_tormentor,
-            "CHAT_MESSAGE_ROSHAN_KILL": self._handle_roshan,
-            "CHAT_MESSAGE_AEGIS": self._handle_aegis,
-        }
+        # Slots are 0-4 (Radiant) and 128-132 (Dire): index per team instead of hashing
+        self._radiant_heroes = tuple(slot_to_hero.get(i, "Unknown") for i in range(5))
+        self._dire_heroes = tuple(slot_to_hero.get(128 + i, "Unknown") for i in range(5))
 
     def process(self, obj: Dict[str, Any]) -> Dict[str, Any]:
         """Process a single objective into structured format."""
         obj_type = obj.get("type", "")
-        handler = self.handlers.get(obj_type, self._handle_unknown)
+        handler = getattr(self, self.HANDLERS.get(obj_type, "_handle_unknown"))
         result = handler(obj)
         result["time"] = self._format_time(obj.get("time", 0))
         return result
 
+    def process_all(self, objectives: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Process a list of objectives, binding hot attributes to locals once."""
+        handlers = self.HANDLERS
+        format_time = self._format_time
+        results: List[Dict[str, Any]] = []
+        append = results.append
+        for obj in objectives:
+            handler = getattr(self, handlers.get(obj.get("type", ""), "_handle_unknown"))
+            result = handler(obj)
+            result["time"] = format_time(obj.get("time", 0))
+            append(result)
+        return results
+
     def _format_time(self, seconds: int) -> str:
-        mins, secs = divmod(seconds, 60)
-        return f"{mins}:{secs:02d}"
+        return _format_seconds(seconds)
 
     def _get_team_from_slot(self, slot: Optional[int]) -> str:
         return "radiant" if slot is not None and slot < 128 else "dire"
 
     def _get_hero(self, slot: Optional[int]) -> str:
-        return self.slot_to_hero.get(slot, "Unknown")
+        if slot is None or slot < 0:
+            return "Unknown"
+        index = slot & 127
+        if index >= 5:
+            return self.slot_to_hero.get(slot, "Unknown")
+        return (self._radiant_heroes if slot < 128 else self._dire_heroes)[index]
 
     def _parse_building(self, key: str) -> tuple:
         """Returns (building_name, benefiting_team, building_type)."""
@@ -170,7 +237,8 @@ class ObjectiveProcessor:
         benefiting = "dire" if "goodguys" in key else "radiant"
 
         # Find building type and category
-        building = next((name for pattern, name in self.BUILDING_PATTERNS if pattern in key), "Building")
+        building_match = self._BUILDING_RE.search(key)
+        building = self._BUILDING_NAMES[building_match.group()] if building_match else "Building"
 
         # Determine building category
         if building == "Ancient":
@@ -183,14 +251,12 @@ class ObjectiveProcessor:
             building_type = "building"
 
         # Find lane
-        lane = next((name for pattern, name in self.LANE_PATTERNS if pattern in key), "")
+        lane_match = self._LANE_RE.search(key)
+        lane = self._LANE_NAMES[lane_match.group()] if lane_match else ""
         return f"{team_prefix} {building} {lane}".strip(), benefiting, building_type
 
     def _parse_unit(self, unit: str) -> str:
-        if "npc_dota_hero_" in unit:
-            hero_internal = unit.replace("npc_dota_hero_", "")
-            return " ".join(w.capitalize() for w in hero_internal.split("_"))
-        return "Creeps" if any(x in unit for x in ["creep", "siege"]) else "Unknown"
+        return _unit_to_display(unit)
 
     def _handle_firstblood(self, obj: Dict) -> Dict:
         slot = obj.get("player_slot")
@@ -246,7 +312,7 @@ class ObjectiveProcessor:
 
     def _handle_unknown(self, obj: Dict) -> Dict:
         obj_type = obj.get("type", "unknown")
-        logger.warning(f"Unknown objective type: {obj_type}")
+        logger.warning("Unknown objective type: %s", obj_type)
         return {
             "type": obj_type.lower().replace("chat_message_", ""),
             "description": obj_type,
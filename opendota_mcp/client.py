@@ -1,11 +1,25 @@
 """
 HTTP client and rate limiter management
 """
+import asyncio
 import httpx
 import logging
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from .classes import RateLimiter
-from .config import OPENDOTA_BASE_URL, RATE_LIMIT_RPM, OPENDOTA_API_KEY
+from .config import (
+    OPENDOTA_BASE_URL, RATE_LIMIT_RPM, OPENDOTA_API_KEY,
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE, HTTP_KEEPALIVE_EXPIRY,
+    RESPONSE_CACHE_TTLS, RESPONSE_CACHE_DEFAULT_TTL, RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_PREFIX_MAX_ENTRIES,
+)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 logger = logging.getLogger("opendota-server")
 
@@ -13,29 +27,46 @@ logger = logging.getLogger("opendota-server")
 rate_limiter = RateLimiter(requests_per_minute=RATE_LIMIT_RPM)
 http_client: Optional[httpx.AsyncClient] = None
 
+# (endpoint, params) -> (expiry as time.monotonic(), raw JSON body), oldest first.
+# Bodies are kept undecoded so every caller gets its own freshly parsed objects.
+_response_cache: Dict[Tuple, Tuple[float, bytes]] = {}
+_response_cache_bytes = 0
+# (endpoint, params) -> future resolved by the request currently fetching that key
+_inflight: Dict[Tuple, asyncio.Future] = {}
+
 
 async def get_http_client() -> httpx.AsyncClient:
     """Get or create the async HTTP client."""
     global http_client
     if http_client is None:
-        headers = {}
+        # httpx transparently decodes brotli/gzip bodies (brotli via the httpx[brotli] extra)
+        headers = {"Accept-Encoding": "br, gzip"}
 
         # Add API key to Authorization header if available
         if OPENDOTA_API_KEY:
             headers["Authorization"] = f"Bearer {OPENDOTA_API_KEY}"
-            logger.info(f"Using API key: {OPENDOTA_API_KEY[:3]}...")
+            logger.info("Using API key: %s...", OPENDOTA_API_KEY[:3])
         else:
             logger.info("HTTP client initialized (anonymous access)")
 
         http_client = httpx.AsyncClient(
+            # Parsed once here; requests pass endpoint paths relative to the API root
+            base_url=OPENDOTA_BASE_URL,
             timeout=httpx.Timeout(
                 connect=10.0,
                 read=120.0,
                 write=10.0,
                 pool=10.0
             ),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            headers=headers
+            # HTTP/2 multiplexes concurrent requests over a single connection,
+            # so keep every pooled connection alive rather than re-handshaking
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                max_connections=HTTP_MAX_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            ),
+            headers=headers,
+            http2=True
         )
     return http_client
 
@@ -49,35 +80,147 @@ async def cleanup_http_client():
         logger.info("HTTP client closed")
 
 
+def _cache_key(endpoint: str, params: Dict[str, Any]) -> Tuple:
+    """Build a hashable cache key from an endpoint and its query parameters."""
+    return (endpoint, tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()
+    )))
+
+
+def _cache_ttl(endpoint: str) -> float:
+    """Get the response cache TTL for an endpoint by path prefix."""
+    for prefix, ttl in RESPONSE_CACHE_TTLS.items():
+        if endpoint.startswith(prefix):
+            return ttl
+    return RESPONSE_CACHE_DEFAULT_TTL
+
+
+def _cache_evict(key: Tuple):
+    """Drop a cached response and release its bytes from the size budget."""
+    global _response_cache_bytes
+    _, body = _response_cache.pop(key)
+    _response_cache_bytes -= len(body)
+
+
+def _cache_get(key: Tuple) -> Optional[bytes]:
+    """Get a cached response body, dropping it if it has expired."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        _cache_evict(key)
+        return None
+    return entry[1]
+
+
+def _cache_store(key: Tuple, ttl: float, body: bytes):
+    """Store a response body, purging expired entries and then the oldest ones over any limit."""
+    global _response_cache_bytes
+    now = time.monotonic()
+    for expired in [k for k, (expiry, _) in _response_cache.items() if expiry <= now]:
+        _cache_evict(expired)
+    if key in _response_cache:
+        _cache_evict(key)
+    if len(body) > RESPONSE_CACHE_MAX_BYTES:
+        return
+
+    endpoint = key[0]
+    for prefix, max_entries in RESPONSE_CACHE_PREFIX_MAX_ENTRIES.items():
+        if endpoint.startswith(prefix):
+            siblings = [k for k in _response_cache if k[0].startswith(prefix)]
+            for oldest in siblings[:max(0, len(siblings) - max_entries + 1)]:
+                _cache_evict(oldest)
+
+    while _response_cache and (
+        len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES
+        or _response_cache_bytes + len(body) > RESPONSE_CACHE_MAX_BYTES
+    ):
+        _cache_evict(next(iter(_response_cache)))
+
+    _response_cache[key] = (now + ttl, body)
+    _response_cache_bytes += len(body)
+
+
+async def _request_body(endpoint: str, params: Dict[str, Any]) -> bytes:
+    """Perform a rate-limited GET against the OpenDota API and return the raw JSON body."""
+    client = await get_http_client()
+    await rate_limiter.acquire()
+
+    logger.debug("Fetching data from %s, with params: %s", endpoint, params)
+
+    try:
+        response = await client.get(endpoint, params=params)
+        response.raise_for_status()
+        return response.content
+    except httpx.HTTPStatusError as e:
+        logger.error("HTTP %s error from %s: %s", e.response.status_code, endpoint, e.response.text[:200])
+        raise
+    except httpx.RequestError as e:
+        logger.error("Request failed for %s: %s", endpoint, e)
+        raise
+
+
+def _inflight_done(key: Tuple, task: asyncio.Task):
+    """Forget a finished shared request and mark its exception as retrieved."""
+    del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def _fetch_shared(key: Tuple, endpoint: str, params: Dict[str, Any]) -> Tuple[bytes, Any]:
+    """
+    Fetch a response on behalf of every caller waiting on this key, and cache it.
+
+    Returns the raw body and its decoded JSON. Only the caller that started the
+    request takes the decoded object; joiners decode their own copy of the body.
+    """
+    body = await _request_body(endpoint, params)
+    # Decode before caching so a malformed body is never stored
+    data = _json_loads(body)
+    _cache_store(key, _cache_ttl(endpoint), body)
+    return body, data
+
+
 async def fetch_api(endpoint: str, params: Optional[Dict[str, Any]] = None) -> dict:
     """
     Fetch data from OpenDota API with rate limiting.
 
     API key is automatically included via Authorization header if configured.
+    Successful responses are cached in-process for a per-endpoint TTL
+    (see RESPONSE_CACHE_TTLS), so repeated lookups don't spend rate-limit budget.
+    Concurrent calls for the same endpoint and params share a single request.
 
     Args:
-        endpoint: API endpoint path
+        endpoint: API endpoint path relative to OPENDOTA_BASE_URL (must start with "/")
         params: Query parameters
 
     Returns:
         JSON response from API
     """
-    client = await get_http_client()
-    await rate_limiter.acquire()
-
     if params is None:
         params = {}
 
-    url = f"{OPENDOTA_BASE_URL}{endpoint}"
-    logger.debug(f"Fetching data from {url}, with params: {params}")
-
-    try:
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        logger.error(f"HTTP {e.response.status_code} error from {url}: {e.response.text[:200]}")
-        raise
-    except httpx.RequestError as e:
-        logger.error(f"Request failed for {url}: {str(e)}")
-        raise
\ No newline at end of file
+    key = _cache_key(endpoint, params)
+    cached = _cache_get(key)
+    if cached is not None:
+        logger.debug("Cache hit for %s, with params: %s", endpoint, params)
+        # Decode raw bytes directly; orjson is considerably faster on large match payloads,
+        # and each caller gets objects it may freely mutate
+        return _json_loads(cached)
+
+    # Join an identical request that is already in flight, or start one
+    pending = _inflight.get(key)
+    if pending is not None:
+        logger.debug("Joining in-flight request for %s, with params: %s", endpoint, params)
+        # Shield so a cancelled caller doesn't cancel the shared request
+        body, _ = await asyncio.shield(pending)
+        return _json_loads(body)
+
+    # The request runs as its own task so no caller's cancellation reaches the others
+    pending = asyncio.ensure_future(_fetch_shared(key, endpoint, params))
+    _inflight[key] = pending
+    pending.add_done_callback(lambda task: _inflight_done(key, task))
+
+    # The starting caller reuses the task's decoded object instead of parsing the body again
+    _, data = await asyncio.shield(pending)
+    return data
@@ -1,12 +1,37 @@
 """
 Configuration and constants for OpenDota MCP Server
 """
+import functools
+import logging
 import os
-from typing import Dict, Any, Optional
+import re
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping, FrozenSet, Tuple
 from dotenv import load_dotenv
 
+logger = logging.getLogger("opendota-server")
+
+
+@functools.cache
+def load_environment():
+    """Load environment variables from .env once per process."""
+    load_dotenv()
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to the default if it is malformed."""
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using default %d", name, value, default)
+        return default
+
+
 # Load environment variables
-load_dotenv()
+load_environment()
 
 # API Configuration
 OPENDOTA_BASE_URL = "https://api.opendota.com/api"
@@ -16,55 +41,123 @@ OPENDOTA_API_KEY: Optional[str] = os.getenv("OPENDOTA_API_KEY") or None
 
 # Default: 50 for anonymous
 RATE_LIMIT_RPM = 50
+# Max player-name lookups in flight at once when resolving account ID lists
+ACCOUNT_LOOKUP_CONCURRENCY = 10
+
+# Upstream connection pool; HTTP/2 multiplexes requests, so a small pool goes a long way
+HTTP_MAX_CONNECTIONS = env_int("HTTPX_POOL", 10)
+HTTP_MAX_KEEPALIVE = env_int("HTTPX_KEEPALIVE", HTTP_MAX_CONNECTIONS)
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# Response cache TTLs (seconds) for GET endpoints, matched by path prefix.
+# Hero/benchmark/record data changes rarely; player and match data can change
+# after new games or a parse request, so they are only cached briefly.
+RESPONSE_CACHE_TTLS: Mapping[str, float] = MappingProxyType({
+    "/heroes": 3600,
+    "/benchmarks": 3600,
+    "/records": 3600,
+    "/scenarios": 3600,
+    "/players": 60,
+    "/matches": 60,
+})
+RESPONSE_CACHE_DEFAULT_TTL = 60
+RESPONSE_CACHE_MAX_ENTRIES = 512
+# Total size of cached response bodies; a single parsed match can be several MB
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Tighter per-prefix entry limits for endpoints with large payloads
+RESPONSE_CACHE_PREFIX_MAX_ENTRIES: Mapping[str, int] = MappingProxyType({
+    "/matches": 16,
+})
 
 # Player cache - pre-populated with known players
-PLAYER_CACHE: Dict[str, str] = {
+PLAYER_CACHE: Mapping[str, str] = MappingProxyType({
     "kürlo": "116856452",
     "ömer": "149733355",
     "hotpocalypse": "79233435",
     "special one": "107409939",
     "xinobillie": "36872251",
     "zøcnutex": "110249858"
-}
+})
+
+
+def player_cache_key(name: str) -> str:
+    """Normalize a player name for PLAYER_CACHE_NORM (casefolded, all whitespace removed)."""
+    return "".join(name.casefold().split())
+
 
-# Reference data storage
+# Normalized once at import; callers should look up with player_cache_key(query)
+PLAYER_CACHE_NORM: Mapping[str, str] = MappingProxyType(
+    {player_cache_key(k): v for k, v in PLAYER_CACHE.items()}
+)
+
+# Reference data files loaded from constants/ at startup
+REFERENCE_FILES = ("heroes", "item_ids", "items", "hero_lore", "aghs_desc")
+
+# Reference data storage (file contents plus indexes derived from them)
 REFERENCE_DATA: Dict[str, Any] = {
     "heroes": {},
     "item_ids": {},
     "items": {},
     "hero_lore": {},
     "aghs_desc": {},
+    # Derived: normalized localized_name -> hero dict
+    "heroes_by_norm": {},
+    # Derived: sorted normalized hero names, for prefix lookups
+    "hero_names_sorted": (),
+    # Derived: heroes_by_norm keys and values materialized once, in matching order
+    "hero_names": (),
+    "heroes_list": (),
+    # Derived: normalized internal/display item name -> internal name (first item wins)
+    "items_by_norm_name": {},
+    "items_by_norm_dname": {},
+    # Derived: internal item names and their normalized internal/display names, in matching order
+    "item_names": (),
+    "item_names_norm": (),
+    "item_dnames_norm": (),
+    # Derived: internal item name -> gold cost (0 when unknown)
+    "item_costs": {},
+    # Derived: hero_id -> aghs_desc entry (first entry wins)
+    "aghs_by_hero_id": {},
 }
 
 # Lane role mappings
-LANE_MAPPING = {
-    # Safe Lane / Carry / Position 1
-    "safe lane": 1, "safelane": 1, "safe": 1, "carry": 1,
-    "pos 1": 1, "position 1": 1, "pos1": 1, "1": 1,
-    "hard support": 1, "hardsupport": 1, "hard sup": 1, "hardsup": 1, 
-    "pos 5": 1, "position 5": 1, "pos5": 1, "5": 1, 
+# Aliases are stored with spaces/underscores/hyphens removed; see normalize_lane_name()
+LANE_ALIASES: Mapping[str, int] = MappingProxyType({
+    # Safe Lane / Carry / Position 1 / Hard Support / Position 5
+    "safelane": 1, "safe": 1, "carry": 1,
+    "hardsupport": 1, "hardsup": 1,
     # Mid Lane / Position 2
-    "mid": 2, "midlane": 2, "mid lane": 2, "middle": 2,
-    "pos 2": 2, "position 2": 2, "pos2": 2, "2": 2,
-    # Off Lane / Offlane / Position 3
-    "off lane": 3, "offlane": 3, "off": 3, "hard lane": 3, "hardlane": 3,
-    "pos 3": 3, "position 3": 3, "pos3": 3, "3": 3,
-    "soft support": 3, "softsupport": 3, "soft sup": 3, "softsup": 3, 
-    "pos 4": 3, "position 4": 3, "pos4": 3, "4": 3, 
+    "mid": 2, "midlane": 2, "middle": 2,
+    # Off Lane / Offlane / Position 3 / Soft Support / Position 4
+    "offlane": 3, "off": 3, "hardlane": 3,
+    "softsupport": 3, "softsup": 3,
     # Jungle / Position 4
     # "jungle": 4, "jungler": 4, "roaming": 4, "roam": 4,
-    # "pos 4": 4, "position 4": 4, "pos4": 4, "4": 4,
-}
+})
+
+# "pos 1", "position 1", "pos1", "1", ... -> position number
+LANE_POSITION_RE = re.compile(r"^(?:pos(?:ition)?)?([1-5])$")
 
-LANE_DESCRIPTIONS = {
+# Supports share a lane with their core: pos 5 plays safe lane, pos 4 plays off lane
+POSITION_TO_LANE: Mapping[int, int] = MappingProxyType({1: 1, 2: 2, 3: 3, 4: 3, 5: 1})
+
+_LANE_SEPARATORS_RE = re.compile(r"[\s_-]+")
+
+
+def normalize_lane_name(lane_name: str) -> str:
+    """Casefold a lane name and strip spaces, underscores and hyphens."""
+    return _LANE_SEPARATORS_RE.sub("", lane_name.casefold())
+
+
+LANE_DESCRIPTIONS: Mapping[int, str] = MappingProxyType({
     1: "Safe Lane (Carry-Position 1/Hard Support-Position 5)",
     2: "Mid Lane (Position 2)",
     3: "Off Lane (Offlane-Position 3/Soft Support-Position 4)",
     4: "Jungle/Roaming (Position 4)"
-}
+})
 
-# Valid statistical fields for histograms and records
-VALID_STAT_FIELDS = {
+# Valid statistical fields for histograms and records (alias -> canonical name)
+VALID_STAT_FIELDS: Mapping[str, str] = MappingProxyType({
     # Combat stats
     "kills": "kills",
     "deaths": "deaths", "death": "deaths",
@@ -82,46 +175,77 @@ VALID_STAT_FIELDS = {
 
     # Match
     "duration": "duration", "match duration": "duration", "matchduration": "duration", "match_length": "duration", "matchlength": "duration"
-}
+})
+# Canonical field names
+VALID_STAT_FIELD_NAMES: FrozenSet[str] = frozenset(VALID_STAT_FIELDS.values())
+VALID_STAT_FIELDS_CANONICAL: Tuple[str, ...] = tuple(sorted(VALID_STAT_FIELD_NAMES))
+# Shown in the "field not recognized" error
+VALID_STAT_FIELDS_HELP = ", ".join(VALID_STAT_FIELDS_CANONICAL[:10])
+# Aliases as a fixed sequence for fuzzy matching
+VALID_STAT_FIELD_ALIASES: Tuple[str, ...] = tuple(VALID_STAT_FIELDS)
+_STAT_FIELD_KEY_TABLE = str.maketrans("", "", " _-")
 
-ITEM_NAME_CONVERSION = {
-    "bfury": ["battle fury", "battle furry"],
-    "ultimate_scepter": ["aghanims scepter", "aghanim scepter", "aghanim", "agh scepter", "scepter", "aghs"],
-    "shard": ["agh shard", "aghanim shard", "aghanims shard", "shard"],
-    "hand_of_midas": ["midas", "hands of midas"],
-    "guardian_grieves": ["guardians of grieves", "guardian of grieves", "grieves"],
-    "spirit_vessel": ["vessel", "spirits vessel", "sprit vessel"],
-    "skadi": ["eye of skadi", "eyes of skadi", "eyeofskadi", "eyesofskadi"],
-    "black_king_bar": ["bkb", "black king"],
-    "monkey_king_bar": ["mkb", "monkey king"],
-    "diffusal_blade": ["diffusal"],
-    "octarine_core": ["octarine"],
-    "travel_boots": ["bot", "bots", "travels", "boots of travel"],
-    "power_treads": ["treads", "pt"],
-    "phase_boots": ["phase"],
-    "tranquil_boots": ["tranquils"]
-}
+
+def stat_field_key(field: str) -> str:
+    """Lowercase a stat field name and drop spaces, underscores and hyphens."""
+    return field.strip().lower().translate(_STAT_FIELD_KEY_TABLE)
+
+
+# stat_field_key(alias) -> canonical name, for single-probe lookups
+STAT_FIELD_INDEX: Mapping[str, str] = MappingProxyType({
+    stat_field_key(alias): canonical
+    for alias, canonical in VALID_STAT_FIELDS.items()
+})
+
+ITEM_NAME_CONVERSION: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "bfury": ("battle fury", "battle furry"),
+    "ultimate_scepter": ("aghanims scepter", "aghanim scepter", "aghanim", "agh scepter", "scepter", "aghs"),
+    "shard": ("agh shard", "aghanim shard", "aghanims shard", "shard"),
+    "hand_of_midas": ("midas", "hands of midas"),
+    "guardian_grieves": ("guardians of grieves", "guardian of grieves", "grieves"),
+    "spirit_vessel": ("vessel", "spirits vessel", "sprit vessel"),
+    "skadi": ("eye of skadi", "eyes of skadi", "eyeofskadi", "eyesofskadi"),
+    "black_king_bar": ("bkb", "black king"),
+    "monkey_king_bar": ("mkb", "monkey king"),
+    "diffusal_blade": ("diffusal",),
+    "octarine_core": ("octarine",),
+    "travel_boots": ("bot", "bots", "travels", "boots of travel"),
+    "power_treads": ("treads", "pt"),
+    "phase_boots": ("phase",),
+    "tranquil_boots": ("tranquils",)
+})
+# Inverted alias -> internal item name; the first item listing an alias wins
+_item_alias_to_id: Dict[str, str] = {}
+for _internal_name, _aliases in ITEM_NAME_CONVERSION.items():
+    for _alias in _aliases:
+        _item_alias_to_id.setdefault(_alias, _internal_name)
+ITEM_ALIAS_TO_ID: Mapping[str, str] = MappingProxyType(_item_alias_to_id)
+
+RANK_NAMES: Mapping[int, str] = MappingProxyType({
+    1: "Herald",
+    2: "Guardian",
+    3: "Crusader",
+    4: "Archon",
+    5: "Legend",
+    6: "Ancient",
+    7: "Divine",
+    8: "Immortal",
+})
+
+# rank_tier (tier * 10 + stars) -> display string, for every tier/star combination
+_RANK_TABLE: Mapping[int, str] = MappingProxyType({
+    tier * 10 + stars: "Immortal" if tier == 8 else f"{name} {min(stars, 5)}"
+    for tier, name in RANK_NAMES.items()
+    for stars in range(10)
+})
 
 def format_rank_tier(rank_tier):
     if not rank_tier:
         return None
     
-    ranks = {
-        1: "Herald",
-        2: "Guardian",
-        3: "Crusader",
-        4: "Archon",
-        5: "Legend",
-        6: "Ancient",
-        7: "Divine",
-        8: "Immortal",
-    }
-    
-    tier = rank_tier // 10
-    stars = min(rank_tier % 10, 5)
-    
-    if tier == 8:
-        return "Immortal"
+    rank = _RANK_TABLE.get(rank_tier)
+    if rank is not None:
+        return rank
     
-    rank_name = ranks.get(tier, "Unknown")
-    return f"{rank_name} {stars}" if rank_name else None
+    # Outside the known tiers
+    return f"Unknown {min(rank_tier % 10, 5)}"
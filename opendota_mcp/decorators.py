@@ -17,36 +17,36 @@ def log_tool_execution(func: Callable) -> Callable:
     @functools.wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
         tool_name = func.__name__
+        log_info = logger.isEnabledFor(logging.INFO)
         
         # Log tool invocation
-        logger.info(f"🔧 Tool called: {tool_name}")
+        if log_info:
+            logger.info("🔧 Tool called: %s", tool_name)
         
-        # Log parameters (safely, without sensitive data)
-        if kwargs:
-            safe_kwargs = {k: v for k, v in kwargs.items() if v is not None}
-            logger.info(f"   Parameters: {safe_kwargs}")
+            # Log parameters (safely, without sensitive data)
+            if kwargs:
+                safe_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+                logger.info("   Parameters: %s", safe_kwargs)
         
-        # Track execution time
-        start_time = time.time()
+        # Track execution time (monotonic, also needed for the error path)
+        start_time = time.perf_counter()
         
         try:
             # Execute the tool
             result = await func(*args, **kwargs)
             
-            # Calculate execution time
-            execution_time = time.time() - start_time
-            
             # Log success
             if isinstance(result, dict) and "error" in result:
-                logger.warning(f"⚠️  Tool {tool_name} returned error: {result.get('error')}")
-            else:
-                logger.info(f"✅ Tool {tool_name} completed in {execution_time:.2f}s")
+                logger.warning("⚠️  Tool %s returned error: %s", tool_name, result.get('error'))
+            elif log_info:
+                execution_time = time.perf_counter() - start_time
+                logger.info("✅ Tool %s completed in %.2fs", tool_name, execution_time)
             
             return result
             
         except Exception as e:
-            execution_time = time.time() - start_time
-            logger.error(f"❌ Tool {tool_name} failed after {execution_time:.2f}s: {str(e)}", exc_info=True)
+            execution_time = time.perf_counter() - start_time
+            logger.error("❌ Tool %s failed after %.2fs: %s", tool_name, execution_time, e, exc_info=True)
             return {"error": str(e)}
     
     return wrapper
\ No newline at end of file
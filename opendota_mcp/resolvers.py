@@ -1,33 +1,50 @@
 """
 Internal resolver functions for converting natural language to IDs
 """
-from typing import Optional, Union, List, Dict, Any
+from typing import Optional, Union, List, Dict, Any, Sequence
+import asyncio
+import bisect
+import functools
 import logging
-from .utils import get_account_id
-from .config import VALID_STAT_FIELDS, REFERENCE_DATA, LANE_MAPPING, LANE_DESCRIPTIONS, ITEM_NAME_CONVERSION
+from .utils import get_account_id, normalize_name
+from .config import ACCOUNT_LOOKUP_CONCURRENCY, VALID_STAT_FIELDS, VALID_STAT_FIELD_ALIASES, VALID_STAT_FIELDS_HELP, STAT_FIELD_INDEX, stat_field_key, REFERENCE_DATA, LANE_ALIASES, LANE_POSITION_RE, POSITION_TO_LANE, LANE_DESCRIPTIONS, normalize_lane_name, ITEM_ALIAS_TO_ID
 from .client import fetch_api
-from .classes import ObjectiveProcessor
-from difflib import SequenceMatcher, get_close_matches
+from .classes import ObjectiveProcessor, _format_seconds
+from rapidfuzz import fuzz, process
 from datetime import datetime
 
 logger = logging.getLogger("opendota-server")
 
+# Top-level match keys returned as their own sections by extract_match_sections
+MATCH_SECTION_KEYS = frozenset([
+    'players', 'teamfights', 'chat', 'picks_bans',
+    'radiant_gold_adv', 'radiant_xp_adv', 'cosmetics', 'all_word_counts'
+])
+# Non-scalar match keys that are still kept as metadata
+MATCH_WORD_COUNT_KEYS = frozenset(['all_word_counts', 'my_word_counts'])
+
+# Player inventory slot keys (item_0 through item_5)
+ITEM_SLOT_KEYS = tuple(f"item_{i}" for i in range(6))
+
 # Fuzzy matching thresholds
 SIMILARITY_THRESHOLD_HIGH = 0.9  # High confidence match
 SIMILARITY_THRESHOLD_MEDIUM = 0.8  # Good match
 SIMILARITY_THRESHOLD_FUZZY = 0.7  # Fuzzy match (allows 1-2 char typos)
 SIMILARITY_THRESHOLD_STAT_FIELD = 0.6  # Stat field matching
 SIMILARITY_THRESHOLD_SUGGESTION = 0.5  # For showing suggestions
+HERO_SUGGESTION_LIMIT = 5  # Max suggestions returned for an unresolved hero name
+MIN_SUBSTRING_MATCH_LENGTH = 3  # Shorter queries hit too many names by accident
 
+# Hero name -> match result, valid for the hero index it was computed against
+HERO_NAME_CACHE_SIZE = 1024
+_hero_name_cache: Dict[str, Dict[str, Any]] = {}
+_hero_name_cache_index: Optional[Dict[str, Any]] = None
 
-def _normalize_name(name: str) -> str:
-    """Remove spaces, hyphens, apostrophes, make lowercase"""
-    return name.lower().replace(" ", "").replace("-", "").replace("'", "")
-
+# Normalized item alias -> internal item name
+_ITEM_ALIAS_INDEX: Dict[str, str] = {}
+for _alias, _internal_name in ITEM_ALIAS_TO_ID.items():
+    _ITEM_ALIAS_INDEX.setdefault(normalize_name(_alias), _internal_name)
 
-def _similarity(a: str, b: str) -> float:
-    """Calculate similarity ratio between two strings"""
-    return SequenceMatcher(None, a, b).ratio()
 
 async def resolve_hero(hero: Optional[Union[int, str]]) -> Optional[int]:
     """
@@ -45,10 +62,10 @@ async def resolve_hero(hero: Optional[Union[int, str]]) -> Optional[int]:
     if hero is None:
         return None
     if isinstance(hero, int):
-        logger.debug(f"Hero already an ID: {hero}")
+        logger.debug("Hero already an ID: %s", hero)
         return hero
     
-    logger.debug(f"Resolving hero name: '{hero}'")
+    logger.debug("Resolving hero name: %r", hero)
     
     # It's a string, look it up with fuzzy matching
     result = await get_hero_id_by_name_logic(hero)
@@ -59,9 +76,13 @@ async def resolve_hero(hero: Optional[Union[int, str]]) -> Optional[int]:
         raise ValueError(f"Hero '{hero}' not found")
     
     hero_id = result["hero_id"]
-    logger.info(f"RESOLVED: hero '{hero}' -> ID {hero_id} ({result.get('localized_name')})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("RESOLVED: hero %r -> ID %s (%s)", hero, hero_id, result.get('localized_name'))
     return hero_id
 
+# Caps concurrent player searches so batched lookups stay within the API rate limit
+_account_lookup_semaphore = asyncio.Semaphore(ACCOUNT_LOOKUP_CONCURRENCY)
+
 async def resolve_hero_list(heroes: Optional[Union[int, str, List[Union[int, str]]]]) -> Optional[Union[int, List[int]]]:
     """
     Internal: Resolve hero names/IDs to hero IDs (supports lists).
@@ -76,10 +97,7 @@ async def resolve_hero_list(heroes: Optional[Union[int, str, List[Union[int, str
         return None
     
     if isinstance(heroes, list):
-        resolved = []
-        for hero in heroes:
-            resolved.append(await resolve_hero(hero))
-        return resolved
+        return list(await asyncio.gather(*(resolve_hero(hero) for hero in heroes)))
     else:
         return await resolve_hero(heroes)
 
@@ -101,20 +119,26 @@ async def resolve_lane(lane: Optional[Union[int, str]]) -> Optional[int]:
     if isinstance(lane, int):
         # Validate range
         if 1 <= lane <= 4:
-            logger.debug(f"Lane already an ID: {lane}")
+            logger.debug("Lane already an ID: %s", lane)
             return lane
         raise ValueError(f"Lane role must be between 1-4, got {lane}")
     
-    logger.debug(f"Resolving lane name: '{lane}'")
-    
     # It's a string, look it up
+    return _resolve_lane_name(lane)
+
+@functools.lru_cache(maxsize=256)
+def _resolve_lane_name(lane: str) -> int:
+    """Resolve a lane name to its lane_role ID (cached; lane aliases never change at runtime)."""
+    logger.debug("Resolving lane name: %r", lane)
+    
     result = convert_lane_name_to_id_logic(lane)
     if "error" in result:
         valid_options = result.get("valid_options", [])
         raise ValueError(f"Lane '{lane}' not recognized. Valid options: {', '.join(valid_options)}")
     
     lane_id = result["lane_role"]
-    logger.info(f"RESOLVED: lane '{lane}' -> ID {lane_id} ({result.get('description')})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("RESOLVED: lane %r -> ID %s (%s)", lane, lane_id, result.get('description'))
     return lane_id
 
 async def resolve_account_ids(account_ids: Optional[Union[str, List[str]]]) -> Optional[List[int]]:
@@ -133,17 +157,16 @@ async def resolve_account_ids(account_ids: Optional[Union[str, List[str]]]) -> O
     if not isinstance(account_ids, list):
         account_ids = [account_ids]
     
-    resolved = []
-    for account_id in account_ids:
+    async def resolve_one(account_id: Union[int, str]) -> int:
         if isinstance(account_id, int):
-            resolved.append(account_id)
-        else:
-            # It's a string (player name), look it up
-            resolved_id = await get_account_id(str(account_id))
-            resolved.append(int(resolved_id))
-    
-    return resolved
+            return account_id
+        # It's a string (player name), look it up
+        async with _account_lookup_semaphore:
+            return int(await get_account_id(str(account_id)))
 
+    return list(await asyncio.gather(*(resolve_one(account_id) for account_id in account_ids)))
+
+@functools.lru_cache(maxsize=512)
 def resolve_stat_field(field: str) -> str:
     """
     Internal: Resolve statistical field name with fuzzy matching.
@@ -168,46 +191,35 @@ def resolve_stat_field(field: str) -> str:
     if not field:
         raise ValueError("Field cannot be empty")
     
-    logger.debug(f"Resolving stat field: '{field}'")
-    
-    # Normalize input: lowercase, remove extra spaces, underscores to spaces
-    field_normalized = field.lower().strip().replace("_", " ").replace("-", " ")
-    
-    # Try exact match first (after normalization)
-    field_key = field_normalized.replace(" ", "_")
-    if field_key in VALID_STAT_FIELDS:
-        result = VALID_STAT_FIELDS[field_key]
-        logger.info(f"RESOLVED: stat field '{field}' -> '{result}'")
-        return result
+    logger.debug("Resolving stat field: %r", field)
     
-    # Try lookup with original (spaces removed)
-    field_nospace = field_normalized.replace(" ", "")
-    if field_nospace in VALID_STAT_FIELDS:
-        result = VALID_STAT_FIELDS[field_nospace]
-        logger.info(f"RESOLVED: stat field '{field}' -> '{result}'")
+    # Exact match: one probe into the prebuilt alias index (spaces/underscores/hyphens ignored)
+    result = STAT_FIELD_INDEX.get(stat_field_key(field))
+    if result is not None:
+        logger.debug("RESOLVED: stat field %r -> %r", field, result)
         return result
     
-    # Try lookup with spaces
-    if field_normalized in VALID_STAT_FIELDS:
-        result = VALID_STAT_FIELDS[field_normalized]
-        logger.info(f"RESOLVED: stat field '{field}' -> '{result}'")
-        return result
+    # Normalize input for fuzzy matching: lowercase, remove extra spaces, underscores to spaces
+    field_normalized = field.lower().strip().replace("_", " ").replace("-", " ")
     
     # Fuzzy matching: check if field is similar to any valid field
-    all_field_variants = list(VALID_STAT_FIELDS.keys())
-    close_matches = get_close_matches(field_normalized, all_field_variants, n=3, cutoff=SIMILARITY_THRESHOLD_STAT_FIELD)
+    close_match = process.extractOne(
+        field_normalized,
+        VALID_STAT_FIELD_ALIASES,
+        scorer=fuzz.ratio,
+        score_cutoff=SIMILARITY_THRESHOLD_STAT_FIELD * 100,
+    )
 
-    if close_matches:
-        best_match = close_matches[0]
+    if close_match:
+        best_match = close_match[0]
         canonical_field = VALID_STAT_FIELDS[best_match]
-        logger.warning(f"WARNING: Field '{field}' fuzzy matched to '{canonical_field}' (via '{best_match}')")
+        logger.warning("WARNING: Field '%s' fuzzy matched to '%s' (via '%s')", field, canonical_field, best_match)
         return canonical_field
     
     # No match found
-    valid_fields = sorted(set(VALID_STAT_FIELDS.values()))
     raise ValueError(
         f"Statistical field '{field}' not recognized. "
-        f"Valid fields: {', '.join(valid_fields[:10])}... "
+        f"Valid fields: {VALID_STAT_FIELDS_HELP}... "
         f"(See documentation for full list)"
     )
 
@@ -227,77 +239,142 @@ async def get_hero_id_by_name_logic(hero_name: str) -> Dict[str, Any]:
         - "Anti-Mage", "anti mage", "antimage" all work
         - "rbick" returns Rubick with fuzzy matching
     """
-    # Use local reference data if available, otherwise fetch from API
-    if REFERENCE_DATA.get('heroes'):
-        # Convert dict to list format
-        heroes = [hero for hero in REFERENCE_DATA['heroes'].values()]
-        logger.info(f"Using local reference data with {len(heroes)} heroes")
-    else:
-        # Fallback to API
-        heroes = await fetch_api("/heroes")
-        logger.info("Using API data (reference data not loaded)")
+    # Use the prebuilt normalized-name index if available, otherwise fetch from API
+    result = get_hero_id_by_name_cached(hero_name)
+    if result is not None:
+        return result
 
-    hero_name_normalized = _normalize_name(hero_name)
+    heroes = await fetch_api("/heroes")
+    logger.info("Using API data (reference data not loaded)")
+    return _match_hero_name(hero_name, {normalize_name(hero['localized_name']): hero for hero in heroes})
 
-    # Step 1: Try exact match (normalized)
-    for hero in heroes:
-        hero_normalized = _normalize_name(hero['localized_name'])
-        if hero_normalized == hero_name_normalized:
-            return {
-                "hero_id": hero['id'],
-                "localized_name": hero['localized_name'],
-                "match_type": "exact"
-            }
+def get_hero_id_by_name_cached(hero_name: str) -> Optional[Dict[str, Any]]:
+    """Synchronous get_hero_id_by_name_logic against reference data; None if it isn't loaded."""
+    heroes_by_norm = REFERENCE_DATA.get('heroes_by_norm')
+    if not heroes_by_norm:
+        return None
 
-    # Step 2: Try fuzzy match (typos, close matches)
-    matches = []
-    for hero in heroes:
-        hero_normalized = _normalize_name(hero['localized_name'])
-        sim = _similarity(hero_name_normalized, hero_normalized)
+    logger.debug("Using local reference data with %d heroes", len(heroes_by_norm))
+    cache = _get_hero_name_cache(heroes_by_norm)
+    result = cache.get(hero_name)
+    if result is None:
+        if len(cache) >= HERO_NAME_CACHE_SIZE:
+            cache.clear()
+        result = cache[hero_name] = _match_hero_name(
+            hero_name,
+            heroes_by_norm,
+            REFERENCE_DATA.get('hero_names'),
+            REFERENCE_DATA.get('heroes_list'),
+            REFERENCE_DATA.get('hero_names_sorted')
+        )
+    # Copy the suggestion/alternative lists too, so callers never share them with the cache
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
 
-        if sim >= SIMILARITY_THRESHOLD_MEDIUM:
-            matches.append({
-                "hero_id": hero['id'],
-                "localized_name": hero['localized_name'],
-                "similarity": sim
-            })
+def _get_hero_name_cache(heroes_by_norm: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Get the hero name resolution cache, resetting it if the hero index was rebuilt."""
+    global _hero_name_cache_index
+    if _hero_name_cache_index is not heroes_by_norm:
+        _hero_name_cache.clear()
+        _hero_name_cache_index = heroes_by_norm
+    return _hero_name_cache
 
-    matches.sort(key=lambda x: x['similarity'], reverse=True)
+def _match_hero_name(
+    hero_name: str,
+    heroes_by_norm: Dict[str, Any],
+    hero_names: Optional[Sequence[str]] = None,
+    hero_list: Optional[Sequence[Dict[str, Any]]] = None,
+    sorted_names: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Match a hero name against a normalized-name index (exact, unique substring, then fuzzy).
 
-    if matches:
-        best_match = matches[0]
-        if best_match['similarity'] >= SIMILARITY_THRESHOLD_HIGH:
-            return {
-                "hero_id": best_match['hero_id'],
-                "localized_name": best_match['localized_name'],
-                "match_type": "fuzzy",
-                "confidence": "high"
-            }
-        else:
-            return {
-                "hero_id": best_match['hero_id'],
-                "localized_name": best_match['localized_name'],
-                "match_type": "fuzzy",
-                "confidence": "medium",
-                "alternatives": [m['localized_name'] for m in matches[:3]]
-            }
+    hero_names/hero_list are heroes_by_norm's keys and values and sorted_names its sorted keys,
+    as prebuilt in REFERENCE_DATA; they are derived here when not supplied.
+    """
+    hero_name_normalized = normalize_name(hero_name)
 
-    # Step 3: No good matches, suggest similar heroes
-    suggestions = []
-    for hero in heroes:
-        hero_normalized = _normalize_name(hero['localized_name'])
-        sim = _similarity(hero_name_normalized, hero_normalized)
-        if sim >= SIMILARITY_THRESHOLD_SUGGESTION:
-            suggestions.append({
-                "name": hero['localized_name'],
-                "similarity": sim
-            })
+    # Step 1: Try exact match (normalized)
+    hero = heroes_by_norm.get(hero_name_normalized)
+    if hero is not None:
+        return {
+            "hero_id": hero['id'],
+            "localized_name": hero['localized_name'],
+            "match_type": "exact"
+        }
 
-    suggestions.sort(key=lambda x: x['similarity'], reverse=True)
+    if not hero_names or hero_list is None or sorted_names is None:
+        hero_names = list(heroes_by_norm)
+        hero_list = list(heroes_by_norm.values())
+        sorted_names = sorted(hero_names)
+
+    # Step 2: A query contained in exactly one hero name is unambiguous ("anti" -> "antimage").
+    # Bisecting the sorted names first rules out queries that prefix several heroes ("dark")
+    # without scanning every name.
+    hero = None
+    if len(hero_name_normalized) >= MIN_SUBSTRING_MATCH_LENGTH:
+        start = bisect.bisect_left(sorted_names, hero_name_normalized)
+        end = bisect.bisect_right(sorted_names, hero_name_normalized + "\U0010ffff", start)
+        if end - start <= 1:
+            substring_hits = [hero for norm, hero in heroes_by_norm.items() if hero_name_normalized in norm]
+            if len(substring_hits) == 1:
+                hero = substring_hits[0]
+    if hero is not None:
+        return {
+            "hero_id": hero['id'],
+            "localized_name": hero['localized_name'],
+            # The one name starting with the query is the unique hit; otherwise it matched mid-name
+            "match_type": "prefix" if end - start == 1 else "substring"
+        }
+
+    # Step 3: Try fuzzy match (typos, close matches)
+    # A high-confidence hit needs only the single best candidate; with a high cutoff
+    # RapidFuzz rejects most names early.
+    best = process.extractOne(
+        hero_name_normalized,
+        hero_names,
+        scorer=fuzz.ratio,
+        score_cutoff=SIMILARITY_THRESHOLD_HIGH * 100,
+    )
+    if best is not None:
+        hero = hero_list[best[2]]
+        return {
+            "hero_id": hero['id'],
+            "localized_name": hero['localized_name'],
+            "match_type": "fuzzy",
+            "confidence": "high"
+        }
+
+    # Otherwise score every hero once; results come back sorted by score.
+    # score_cutoff also lets RapidFuzz skip names whose length alone rules them out.
+    # Only the top HERO_SUGGESTION_LIMIT are kept (heap selection, not a full sort):
+    # that covers the 5 suggestions and the 3 alternatives drawn from the best matches.
+    scored = process.extract(
+        hero_name_normalized,
+        hero_names,
+        scorer=fuzz.ratio,
+        score_cutoff=SIMILARITY_THRESHOLD_SUGGESTION * 100,
+        limit=HERO_SUGGESTION_LIMIT,
+    )
+    matches = [
+        hero_list[index]['localized_name']
+        for _, score, index in scored
+        if score >= SIMILARITY_THRESHOLD_MEDIUM * 100
+    ]
+
+    if matches:
+        best_match = hero_list[scored[0][2]]
+        return {
+            "hero_id": best_match['id'],
+            "localized_name": best_match['localized_name'],
+            "match_type": "fuzzy",
+            "confidence": "medium",
+            "alternatives": matches[:3]
+        }
 
+    # Step 4: No good matches, suggest similar heroes
     return {
         "error": f"Hero '{hero_name}' not found",
-        "suggestions": [s['name'] for s in suggestions[:5]]
+        "suggestions": [hero_list[index]['localized_name'] for _, _, index in scored]
     }
 
 async def get_hero_by_id_logic(hero_id: int) -> Dict[str, Any]:
@@ -319,27 +396,41 @@ async def get_hero_by_id_logic(hero_id: int) -> Dict[str, Any]:
         get_hero_by_id(1) returns all data for Anti-Mage
     """
     # Use local reference data if available
-    if REFERENCE_DATA.get('heroes'):
-        hero_id_str = str(hero_id)
-        if hero_id_str in REFERENCE_DATA['heroes']:
-            hero_data = REFERENCE_DATA['heroes'][hero_id_str]
-            logger.info(f"Found hero {hero_id} ({hero_data.get('localized_name')}) in reference data")
-            return hero_data
-        else:
-            return {
-                "error": f"Hero with ID {hero_id} not found in reference data"
-            }
-    else:
-        # Fallback to API
-        heroes = await fetch_api("/heroes")
-        for hero in heroes:
-            if hero['id'] == hero_id:
-                logger.info(f"Found hero {hero_id} ({hero.get('localized_name')}) via API")
-                return hero
+    hero_data = get_hero_by_id_cached(hero_id)
+    if hero_data is not None:
+        return hero_data
+
+    # Fallback to API
+    heroes = await fetch_api("/heroes")
+    for hero in heroes:
+        if hero['id'] == hero_id:
+            logger.debug("Found hero %s (%s) via API", hero_id, hero.get('localized_name'))
+            return hero
+    return {
+        "error": f"Hero with ID {hero_id} not found"
+    }
+
+def get_hero_by_id_cached(hero_id: int) -> Optional[Dict[str, Any]]:
+    """Synchronous get_hero_by_id_logic against reference data; None if it isn't loaded."""
+    heroes = REFERENCE_DATA.get('heroes')
+    if not heroes:
+        return None
+
+    hero_data = heroes.get(str(hero_id))
+    if hero_data is None:
         return {
-            "error": f"Hero with ID {hero_id} not found"
+            "error": f"Hero with ID {hero_id} not found in reference data"
         }
-    
+    logger.debug("Found hero %s (%s) in reference data", hero_id, hero_data.get('localized_name'))
+    return hero_data
+
+async def get_heroes_by_ids(hero_ids: List[int]) -> List[Dict[str, Any]]:
+    """Look up several heroes by ID, hitting the API (concurrently) only without reference data."""
+    heroes = [get_hero_by_id_cached(hero_id) for hero_id in hero_ids]
+    if any(hero is None for hero in heroes):
+        heroes = await asyncio.gather(*(get_hero_by_id_logic(hero_id) for hero_id in hero_ids))
+    return list(heroes)
+
 def convert_lane_name_to_id_logic(lane_name: str) -> Dict[str, Any]:
     """
     Convert lane/position names to lane_role IDs.
@@ -356,10 +447,14 @@ def convert_lane_name_to_id_logic(lane_name: str) -> Dict[str, Any]:
         - "carry", "safe lane", "pos 1" all return lane_role 1
         - "offlane", "offline", "pos 3" all return lane_role 3
     """
-    lane_name_lower = lane_name.lower().strip()
-    
-    if lane_name_lower in LANE_MAPPING:
-        lane_role = LANE_MAPPING[lane_name_lower]
+    lane_key = normalize_lane_name(lane_name)
+    lane_role = LANE_ALIASES.get(lane_key)
+    if lane_role is None:
+        position_match = LANE_POSITION_RE.match(lane_key)
+        if position_match:
+            lane_role = POSITION_TO_LANE[int(position_match.group(1))]
+
+    if lane_role is not None:
         return {
             "lane_role": lane_role,
             "description": LANE_DESCRIPTIONS[lane_role]
@@ -370,35 +465,38 @@ def convert_lane_name_to_id_logic(lane_name: str) -> Dict[str, Any]:
         "valid_options": ["mid", "safe lane", "offlane", "jungle", "pos 1-4"]
     }
 
-async def get_item_display_name_by_id(item_id: Union[int, str]) -> str:
-    def format_item_name(internal_name: str) -> str:
-        """Convert internal_name to display format with lowercase articles."""
-        words = internal_name.replace("_", " ").split()
-        lowercase_words = {'of', 'the', 'and', 'a', 'an', 'in', 'on', 'at', 'to'}
-        
-        formatted = []
-        for i, word in enumerate(words):
-            if i == 0 or word not in lowercase_words:
-                formatted.append(word.capitalize())
-            else:
-                formatted.append(word.lower())
-        
-        return " ".join(formatted)
-
-    if REFERENCE_DATA.get('item_ids'):
-        item_id_str = str(item_id)
-        if item_id_str in REFERENCE_DATA['item_ids']:
-            item_name = REFERENCE_DATA['item_ids'][item_id_str]
-            logger.info(f"Found item {item_id} ({item_name}) in reference data")
-            return format_item_name(item_name)
+# Words kept lowercase in item display names (unless first)
+_ITEM_NAME_LOWERCASE_WORDS = frozenset({'of', 'the', 'and', 'a', 'an', 'in', 'on', 'at', 'to'})
+
+@functools.lru_cache(maxsize=1024)
+def _format_item_name(internal_name: str) -> str:
+    """Convert internal_name to display format with lowercase articles."""
+    words = internal_name.replace("_", " ").split()
+    
+    formatted = []
+    for i, word in enumerate(words):
+        if i == 0 or word not in _ITEM_NAME_LOWERCASE_WORDS:
+            formatted.append(word.capitalize())
+        else:
+            formatted.append(word.lower())
+    
+    return " ".join(formatted)
+
+def get_item_display_name_by_id(item_id: Union[int, str]) -> str:
+    item_ids = REFERENCE_DATA.get('item_ids')
+    if item_ids:
+        item_name = item_ids.get(str(item_id))
+        if item_name is not None:
+            logger.debug("Found item %s (%s) in reference data", item_id, item_name)
+            return _format_item_name(item_name)
         else:
-            logger.info(f"Item with ID {item_id} not found in reference data, returning {item_id}")
+            logger.debug("Item with ID %s not found in reference data, returning %s", item_id, item_id)
             return item_id
     else:
-        logger.info(f"Item with ID {item_id} not found in reference data, returning {item_id}")
+        logger.debug("Item with ID %s not found in reference data, returning %s", item_id, item_id)
         return item_id
 
-async def resolve_item_to_internal_name(item_input: str) -> str:
+def resolve_item_to_internal_name(item_input: str) -> str:
     """
     Resolve item display name or fuzzy name to internal name.
 
@@ -415,64 +513,64 @@ async def resolve_item_to_internal_name(item_input: str) -> str:
     if item_input is None:
         return None
 
-    if not REFERENCE_DATA.get('items'):
+    items = REFERENCE_DATA.get('items')
+    if not items:
         raise ValueError("Items reference data not loaded")
 
-    items = REFERENCE_DATA['items']
-    input_normalized = _normalize_name(item_input)
+    input_normalized = normalize_name(item_input)
 
-    # Step 1: Check ITEM_NAME_CONVERSION for known aliases
-    for internal_name, aliases in ITEM_NAME_CONVERSION.items():
-        for alias in aliases:
-            if _normalize_name(alias) == input_normalized:
-                logger.info(f"Matched '{item_input}' to '{internal_name}' via alias")
-                return internal_name
+    # Step 1: Check known aliases (ITEM_NAME_CONVERSION)
+    internal_name = _ITEM_ALIAS_INDEX.get(input_normalized)
+    if internal_name is not None:
+        logger.debug("Matched %r to %r via alias", item_input, internal_name)
+        return internal_name
 
     # Step 2: Try exact match on internal name (e.g., "diffusal_blade")
-    for key in items.keys():
-        if _normalize_name(key) == input_normalized:
-            logger.info(f"Exact match: '{item_input}' → '{key}'")
-            return key
+    internal_name = REFERENCE_DATA['items_by_norm_name'].get(input_normalized)
+    if internal_name is not None:
+        logger.debug("Exact match: %r → %r", item_input, internal_name)
+        return internal_name
 
     # Step 3: Try exact match on display name (e.g., "Diffusal Blade")
-    for internal_name, item_data in items.items():
-        dname = item_data.get('dname', '')
-        if _normalize_name(dname) == input_normalized:
-            logger.info(f"Display name match: '{item_input}' → '{internal_name}'")
-            return internal_name
+    internal_name = REFERENCE_DATA['items_by_norm_dname'].get(input_normalized)
+    if internal_name is not None:
+        logger.debug("Display name match: %r → %r", item_input, internal_name)
+        return internal_name
 
     # Step 4: Fuzzy match on both internal names and display names
-    matches = []
-    for internal_name, item_data in items.items():
-        dname = item_data.get('dname', '')
-
-        # Score against internal name
-        internal_sim = _similarity(input_normalized, _normalize_name(internal_name))
-        # Score against display name
-        display_sim = _similarity(input_normalized, _normalize_name(dname))
-
-        best_sim = max(internal_sim, display_sim)
-
-        if best_sim >= SIMILARITY_THRESHOLD_FUZZY:
-            matches.append({
-                'internal_name': internal_name,
-                'display_name': dname,
-                'similarity': best_sim
-            })
-
-    if matches:
-        # Sort by similarity, highest first
-        matches.sort(key=lambda x: x['similarity'], reverse=True)
-        best_match = matches[0]
-
-        logger.info(f"Fuzzy match: '{item_input}' → '{best_match['internal_name']}' (similarity: {best_match['similarity']:.2f})")
-        return best_match['internal_name']
+    # Score each name list with RapidFuzz, keeping the best score per item. A strict
+    # cutoff runs first: any hit there beats everything the looser pass could add, and
+    # RapidFuzz rejects most candidates early under a high cutoff.
+    item_names = REFERENCE_DATA['item_names']
+    name_lists = (REFERENCE_DATA['item_names_norm'], REFERENCE_DATA['item_dnames_norm'])
+    best_scores: Dict[int, float] = {}
+    for cutoff in (SIMILARITY_THRESHOLD_HIGH, SIMILARITY_THRESHOLD_FUZZY):
+        for choices in name_lists:
+            for _, score, index in process.extract(
+                input_normalized,
+                choices,
+                scorer=fuzz.ratio,
+                score_cutoff=cutoff * 100,
+                limit=None,
+            ):
+                if score > best_scores.get(index, -1):
+                    best_scores[index] = score
+        if best_scores:
+            break
+
+    if best_scores:
+        # Highest similarity wins; ties go to the item listed first
+        best_index = min(best_scores, key=lambda index: (-best_scores[index], index))
+        best_match = item_names[best_index]
+
+        logger.debug("Fuzzy match: %r → %r (similarity: %.2f)", item_input, best_match, best_scores[best_index] / 100)
+        return best_match
 
     # Step 5: No match found - provide suggestions
     suggestions = [item_data.get('dname', key) for key, item_data in list(items.items())[:5]]
     raise ValueError(f"Item '{item_input}' not found. Example items: {', '.join(suggestions)}")
 
-async def get_item_details_logic(item_internal_name: str) -> Dict[str, Any]:
+def get_item_details_logic(item_internal_name: str) -> Dict[str, Any]:
     """
     Get item details from items.json using internal name.
 
@@ -482,15 +580,16 @@ async def get_item_details_logic(item_internal_name: str) -> Dict[str, Any]:
     Returns:
         Complete item data dictionary
     """
-    if not REFERENCE_DATA.get('items'):
+    items = REFERENCE_DATA.get('items')
+    if not items:
         return {"error": "Items reference data not loaded"}
 
-    if item_internal_name in REFERENCE_DATA['items']:
-        item_details = REFERENCE_DATA['items'][item_internal_name]
-        logger.info(f"Found item '{item_internal_name}' in reference data")
+    item_details = items.get(item_internal_name)
+    if item_details is not None:
+        logger.debug("Found item %r in reference data", item_internal_name)
         return item_details
     else:
-        logger.error(f"Item '{item_internal_name}' not found in items.json")
+        logger.error("Item '%s' not found in items.json", item_internal_name)
         return {"error": f"Item '{item_internal_name}' not found"}
 
 def get_aghs_details_logic(hero_id: int) -> Dict[str, Any]:
@@ -516,13 +615,12 @@ def get_aghs_details_logic(hero_id: int) -> Dict[str, Any]:
     if not REFERENCE_DATA.get('aghs_desc'):
         return {"error": "Aghanim's descriptions not loaded"}
 
-    # aghs_desc is an array, find the hero by hero_id
-    for hero_aghs in REFERENCE_DATA['aghs_desc']:
-        if hero_aghs.get('hero_id') == hero_id:
-            logger.info(f"Found Aghanim's details for hero ID {hero_id}")
-            return hero_aghs
+    hero_aghs = REFERENCE_DATA['aghs_by_hero_id'].get(hero_id)
+    if hero_aghs is not None:
+        logger.debug("Found Aghanim's details for hero ID %s", hero_id)
+        return hero_aghs
 
-    logger.error(f"No Aghanim's details found for hero ID {hero_id}")
+    logger.error("No Aghanim's details found for hero ID %s", hero_id)
     return {"error": f"No Aghanim's details found for hero ID {hero_id}"}
 
 async def extract_match_sections(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -549,48 +647,39 @@ async def extract_match_sections(data: Dict[str, Any]) -> Dict[str, Any]:
         >>> teamfights = sections['teamfights']
         >>> metadata = sections['metadata']
     """
-    def format_time(seconds: int) -> str:
-        """Format seconds to MM:SS"""
-        mins = seconds // 60
-        secs = seconds % 60
-        return f"{mins}:{secs:02d}"
-
     # Handle JSON-RPC wrapper (if present)
     try:
-        if 'result' in data and 'structuredContent' in data.get('result', {}):
+        if 'match_id' in data and 'players' in data:
+            match = data
+            logger.info("Using data directly as match")
+        elif 'result' in data and 'structuredContent' in data.get('result', {}):
             match = data['result']['structuredContent']
             logger.info("Extracted match from JSON-RPC result wrapper")
         elif 'structuredContent' in data:
             match = data['structuredContent']
             logger.info("Extracted match from structuredContent")
-        elif 'match_id' in data and 'players' in data:
-            match = data
-            logger.info("Using data directly as match")
         else:
-            logger.error(f"Could not find match data. Keys: {list(data.keys())}")
+            logger.error("Could not find match data. Keys: %s", list(data.keys()))
             raise ValueError(
                 f"Could not find match data in JSON. Top-level keys: {list(data.keys())}"
             )
     except (KeyError, AttributeError) as e:
-        logger.error(f"Data structure error: {e}")
+        logger.error("Data structure error: %s", e)
         raise ValueError(f"Invalid data structure: {e}")
 
     # Validate match data
     if not isinstance(match, dict):
-        logger.error(f"Match data is not a dictionary: {type(match).__name__}")
+        logger.error("Match data is not a dictionary: %s", type(match).__name__)
         raise ValueError(f"Match data must be a dictionary, got {type(match).__name__}")
 
-    # Extract sections into a dictionary
+    # Extract sections and metadata (all scalar values) in one pass
     sections = {}
-
-    section_keys = [
-        'players', 'teamfights', 'chat', 'picks_bans',
-        'radiant_gold_adv', 'radiant_xp_adv', 'cosmetics', 'all_word_counts'
-    ]
-
-    for section in section_keys:
-        if section in match:
-            sections[section] = match[section]
+    metadata = {}
+    for k, v in match.items():
+        if k in MATCH_SECTION_KEYS:
+            sections[k] = v
+        if not isinstance(v, (list, dict)) or k in MATCH_WORD_COUNT_KEYS:
+            metadata[k] = v
 
     # Process objectives with human-readable descriptions
     if 'objectives' in match and 'players' in match:
@@ -598,33 +687,29 @@ async def extract_match_sections(data: Dict[str, Any]) -> Dict[str, Any]:
     elif 'objectives' in match:
         sections['objectives'] = match['objectives']  # Fallback to raw if no players
 
-    logger.info(f"Extracted {len(sections)} sections: {list(sections.keys())}")
-
-
-    # Add metadata (all scalar values)
+    # Add metadata
     try:
-        metadata = {k: v for k, v in match.items()
-                    if not isinstance(v, (list, dict)) or k in ['all_word_counts', 'my_word_counts']}
         #sections['metadata'] = metadata
         sections['metadata'] = {
             "match_id": metadata.get("match_id", 0),
             "match_date": datetime.fromtimestamp(metadata.get("start_time")).strftime("%Y-%m-%d"),
-            "match_duration": format_time(metadata.get("duration", 0)),
+            "match_duration": _format_seconds(metadata.get("duration", 0)),
             "radiant_score": metadata.get("radiant_score", 0),
             "dire_score": metadata.get("dire_score", 0),
             "radiant_win": metadata.get("radiant_win", False),
-            "first_blood_time": format_time(metadata.get("first_blood_time", 0)),
+            "first_blood_time": _format_seconds(metadata.get("first_blood_time", 0)),
             "replay_url": metadata.get("replay_url", ""),
             "replay_salt": metadata.get("replay_salt", 0),
             "patch": metadata.get("patch", 0),
             "game_mode": metadata.get("game_mode", 0),
             "region": metadata.get("region", 0),
         }
-        logger.info(f"Extracted metadata with {len(metadata)} fields")
     except AttributeError as e:
-        logger.error(f"Failed to extract metadata: {e}")
+        logger.error("Failed to extract metadata: %s", e)
         raise ValueError(f"Failed to extract metadata: {e}")
 
+    logger.info("Extracted %d sections (%d metadata fields): %s", len(sections), len(metadata), list(sections))
+
     return sections
 
 def get_lane_role_by_id_logic(lane_role: int) -> Dict[str, Any]:
@@ -654,14 +739,14 @@ def get_lane_role_by_id_logic(lane_role: int) -> Dict[str, Any]:
             f"Invalid lane_role: {lane_role}. Valid values are 1-4"
         )
     
-    logger.info(f"Retrieved lane description for ID {lane_role}: {LANE_DESCRIPTIONS[lane_role]}")
+    logger.debug("Retrieved lane description for ID %s: %s", lane_role, LANE_DESCRIPTIONS[lane_role])
 
     return {
         "lane_role": lane_role,
         "lane_role_name": LANE_DESCRIPTIONS[lane_role]
     }
 
-async def process_player_items(player: Dict[str, Any]) -> Dict[str, Any]:
+def process_player_items(player: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process player item data into a structured format.
 
@@ -679,54 +764,43 @@ async def process_player_items(player: Dict[str, Any]) -> Dict[str, Any]:
         - neutral: Neutral item name or null
         - key_timings: List of {item, time, time_formatted} for major items
     """
-    def format_time(seconds: int) -> str:
-        """Format seconds to MM:SS"""
-        mins = seconds // 60
-        secs = seconds % 60
-        return f"{mins}:{secs:02d}"
-
-    def get_item_cost(item_name: str) -> int:
-        """Get item cost from items.json"""
-        if REFERENCE_DATA.get('items') and item_name in REFERENCE_DATA['items']:
-            return REFERENCE_DATA['items'][item_name].get('cost', 0)
-        return 0
+    player_get = player.get
 
     # Extract final build (item_0 through item_5)
     final_build = []
-    for i in range(6):
-        item_id = player.get(f"item_{i}", 0)
+    for slot in ITEM_SLOT_KEYS:
+        item_id = player_get(slot, 0)
         try:
             if item_id and item_id != 0:
-                item_name = await get_item_display_name_by_id(item_id)
-                final_build.append(item_name)
+                final_build.append(get_item_display_name_by_id(item_id))
             else:
                 final_build.append(None)
         except Exception as e:
-            logger.error(f"Failed to resolve item {item_id}: {e}")
+            logger.error("Failed to resolve item %s: %s", item_id, e)
             final_build.append(None)
 
     # Extract neutral item
-    neutral_item_id = player.get("item_neutral", 0)
+    neutral_item_id = player_get("item_neutral", 0)
     neutral_item = None
     if neutral_item_id and neutral_item_id != 0:
-        neutral_item = await get_item_display_name_by_id(neutral_item_id)
+        neutral_item = get_item_display_name_by_id(neutral_item_id)
 
     # Extract key item timings (items with cost >= 2000 gold)
     key_timings = []
-    purchase_log = player.get("purchase_log", [])
+    item_costs = REFERENCE_DATA.get('item_costs') or {}
 
-    for purchase in purchase_log:
+    for purchase in player_get("purchase_log", []):
         item_name = purchase.get("key")
         time = purchase.get("time")
 
         if item_name and time is not None:
-            cost = get_item_cost(item_name)
+            cost = item_costs.get(item_name, 0)
 
             # Only include items >= 2000 gold and positive time (exclude pre-game)
             if cost >= 2000 and time >= 0:
                 key_timings.append({
                     "item": item_name,
-                    "time_formatted": format_time(time)
+                    "time_formatted": _format_seconds(time)
                 })
 
     return {
@@ -749,23 +823,19 @@ async def build_player_list(players: List[Dict[str, Any]], benchmark_fields: Lis
         - gold_timings_per_hero: Dict mapping hero name to gold_t list
         - xp_timings_per_hero: Dict mapping hero name to xp_t list
     """
-    def format_time(seconds: int) -> str:
-        """Format seconds to MM:SS"""
-        mins = seconds // 60
-        secs = seconds % 60
-        return f"{mins}:{secs:02d}"
-
     result = []
     gold_timings_per_hero = {}
     xp_timings_per_hero = {}
 
-    for p in players:
+    # Look up every player's hero at once
+    heroes_per_player = await get_heroes_by_ids([p.get("hero_id") for p in players])
+
+    for p, hero_data in zip(players, heroes_per_player):
         # Process item data
-        items_data = await process_player_items(p)
+        items_data = process_player_items(p)
 
         # Get hero name once for reuse
         hero_id = p.get("hero_id")
-        hero_data = await get_hero_by_id_logic(hero_id)
         hero_name = hero_data.get("localized_name", f"Hero {hero_id}")
 
         # Build gold/xp timings per hero
@@ -776,11 +846,22 @@ async def build_player_list(players: List[Dict[str, Any]], benchmark_fields: Lis
         if xp_t:
             xp_timings_per_hero[hero_name] = xp_t
 
+        damage_taken = p.get("damage_taken")
+        team = "radiant" if p.get("player_slot", 0) < 128 else "dire"
+        benchmarks = p.get("benchmarks") or {}
+        player_benchmarks = {}
+        for field in benchmark_fields:
+            benchmark = benchmarks.get(field) or {}
+            player_benchmarks[field] = {
+                "raw": benchmark.get("raw"),
+                "pct": (benchmark.get("pct") or 0) * 100
+            }
+
         player_dict = {
             "account_id": p.get("account_id"),
             "hero_name": hero_name,
             "personaname": p.get("personaname"),
-            "team": "radiant" if p.get("player_slot", 0) < 128 else "dire",
+            "team": team,
             "kills": p.get("kills"),
             "deaths": p.get("deaths"),
             "assists": p.get("assists"),
@@ -790,9 +871,9 @@ async def build_player_list(players: List[Dict[str, Any]], benchmark_fields: Lis
             "hero_damage": p.get("hero_damage"),
             "tower_damage": p.get("tower_damage"),
             "hero_healing": p.get("hero_healing"),
-            "damage_taken": sum(p.get("damage_taken", {}).values()),
+            "damage_taken": sum(damage_taken.values()) if damage_taken else 0,
             "teamfight_participation": p.get("teamfight_participation"),
-            "time_spent_dead": format_time(p.get("life_state_dead", 0)),
+            "time_spent_dead": _format_seconds(p.get("life_state_dead", 0)),
             "last_hits": p.get("last_hits"),
             "denies": p.get("denies"),
             "items": items_data,
@@ -802,13 +883,7 @@ async def build_player_list(players: List[Dict[str, Any]], benchmark_fields: Lis
                 "camp_stacked": p.get("camps_stacked"),
                 "stuns": p.get("stuns"),
             },
-            "benchmarks": {
-                field: {
-                    "raw": p.get("benchmarks", {}).get(field, {}).get("raw"),
-                    "pct": (p.get("benchmarks", {}).get(field, {}).get("pct") or 0) * 100
-                }
-                for field in benchmark_fields
-            }
+            "benchmarks": player_benchmarks
         }
         result.append(player_dict)
 
@@ -831,17 +906,12 @@ async def build_teamfight_list(teamfights: List[Dict[str, Any]], players: List[D
         - Basic info (start, end, last_death, deaths)
         - Player data with hero names, kills, deaths, damage, healing, gold/xp delta
     """
-    def format_time(seconds: int) -> str:
-        """Format seconds to MM:SS"""
-        mins = seconds // 60
-        secs = seconds % 60
-        return f"{mins}:{secs:02d}"
-
     # Build mapping from teamfight player index (0-9) to hero name
     # Teamfight players are ordered: indices 0-4 = Radiant, 5-9 = Dire
     # player_slot: 0-127 = Radiant, 128-255 = Dire
     player_index_to_hero = {}
-    for p in players:
+    heroes_per_player = await get_heroes_by_ids([p.get("hero_id") for p in players])
+    for p, hero_data in zip(players, heroes_per_player):
         player_slot = p.get("player_slot", 0)
         hero_id = p.get("hero_id")
 
@@ -853,7 +923,6 @@ async def build_teamfight_list(teamfights: List[Dict[str, Any]], players: List[D
             # Dire: slots 128-132 map to indices 5-9
             tf_index = (player_slot - 128) + 5
 
-        hero_data = await get_hero_by_id_logic(hero_id)
         player_index_to_hero[tf_index] = hero_data.get("localized_name", f"Hero {hero_id}")
 
     result = []
@@ -892,9 +961,9 @@ async def build_teamfight_list(teamfights: List[Dict[str, Any]], players: List[D
         gold_swing = radiant_gold_delta - dire_gold_delta
 
         teamfight_dict = {
-            "start": format_time(tf.get("start", 0)),
-            "end": format_time(tf.get("end", 0)),
-            "last_death": format_time(tf.get("last_death", 0)),
+            "start": _format_seconds(tf.get("start", 0)),
+            "end": _format_seconds(tf.get("end", 0)),
+            "last_death": _format_seconds(tf.get("last_death", 0)),
             "deaths": tf.get("deaths", 0),
             "radiant_gold_delta": radiant_gold_delta,
             "dire_gold_delta": dire_gold_delta,
@@ -921,17 +990,13 @@ async def build_objectives(objectives: List[Dict[str, Any]], players: List[Dict[
     """
     # Build player slot to hero name mapping
     slot_to_hero = {}
-    for p in players:
+    heroes_per_player = await get_heroes_by_ids([p.get("hero_id") for p in players])
+    for p, hero_data in zip(players, heroes_per_player):
         player_slot = p.get("player_slot", 0)
         hero_id = p.get("hero_id")
-        hero_data = await get_hero_by_id_logic(hero_id)
         slot_to_hero[player_slot] = hero_data.get("localized_name", f"Hero {hero_id}")
 
     # Create processor with context
     processor = ObjectiveProcessor(slot_to_hero)
 
-    structured_objectives = []
-    for obj in objectives:
-        structured_objectives.append(processor.process(obj))
-
-    return structured_objectives
+    return processor.process_all(objectives)
@@ -2,35 +2,63 @@
 OpenDota MCP Server - Deployment Ready
 Works with Claude Desktop (stdio) AND Cloud Run (HTTP)
 """
+import asyncio
+import atexit
+import gc
+import hashlib
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from contextlib import asynccontextmanager
-from datetime import datetime
+from time import perf_counter_ns
+from functools import lru_cache
+from types import SimpleNamespace
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastmcp import FastMCP
+import orjson
 
 # Setup logging
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(
-    level=log_level,
-    format="%(asctime)s [%(levelname)s] %(name)s - %(message)s",
+_log_handler = logging.StreamHandler(sys.stderr)
+_log_handler.setFormatter(logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(name)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[logging.StreamHandler(sys.stderr)]
-)
+))
+# Handlers only enqueue records; a listener thread does the blocking stderr writes
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+# Like basicConfig, leave an already-configured root logger alone
+if not _root_logger.handlers:
+    _root_logger.setLevel(log_level)
+    _root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+    _log_listener.start()
+    # Drain queued records before logging.shutdown() flushes the stream handler
+    atexit.register(_log_listener.stop)
 
 logger = logging.getLogger("opendota-server")
 
 from .tools import register_all_tools
-from .client import cleanup_http_client
+from .client import cleanup_http_client, get_http_client
 from .utils import load_reference_data
+from .config import OPENDOTA_API_KEY, env_int
+
+@lru_cache(maxsize=1)
+def get_settings() -> SimpleNamespace:
+    """Process settings read once, after config has loaded .env"""
+    return SimpleNamespace(
+        transport=os.getenv("MCP_TRANSPORT", "stdio").lower(),
+        port=env_int("PORT", 8080),
+        # More than one worker serves MCP statelessly; see http_app_factory
+        workers=env_int("WEB_CONCURRENCY", 1),
+    )
 
 @asynccontextmanager
 async def app_lifespan(server):
     """FastMCP lifespan management"""
-    from .config import OPENDOTA_API_KEY
-
     logger.info("Starting OpenDota MCP server...")
 
     # Check API key status
@@ -39,9 +67,18 @@ async def app_lifespan(server):
     else:
         logger.info("ℹ️  No API key - using anonymous access (50 req/min)")
 
-    # Startup
-    load_reference_data()
+    # Startup: reference files load off the loop while the tools payload is serialized
+    ref_task = asyncio.create_task(asyncio.to_thread(load_reference_data))
+    if get_settings().transport == "http":
+        # Only the HTTP routes use the tool snapshot; stdio clients list tools over MCP
+        await build_tools_payload()
+    await ref_task
     logger.info("✅ Reference data loaded")
+    # Config tables and reference data are read-only from here on; keep them out of GC scans
+    gc.freeze()
+
+    # Create the pooled upstream client now rather than on the first tool call
+    await get_http_client()
 
     try:
         yield
@@ -56,66 +93,96 @@ logger.info("Registering tools...")
 register_all_tools(mcp)
 logger.info("✅ Tools registered")
 
+# Registered tools by name, plus the pre-serialized /debug/tools body and its ETag, built once in the lifespan
+_TOOLS = None
+_TOOLS_CACHE_BYTES = None
+_TOOLS_CACHE_ETAG = None
+
 # Add custom routes using the @custom_route decorator
+# The health payload never changes; encode it once for the Cloud Run probes
+_HEALTH_BYTES = b'{"status":"healthy","service":"opendota-mcp"}'
+_HEALTH_HEADERS = {"cache-control": "no-cache"}
+
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request):
     """Health check endpoint for Cloud Run"""
-    return JSONResponse({"status": "healthy", "service": "opendota-mcp"})
+    return Response(content=_HEALTH_BYTES, media_type="application/json", headers=_HEALTH_HEADERS)
 
-@mcp.custom_route("/debug/tools", methods=["GET"])
-async def list_tools(request: Request):
-    """List all registered MCP tools with full descriptions and parameter schemas"""
-    try:
-        # Use the public get_tools() API (async)
-        tools_dict = await mcp.get_tools()
+async def build_tools_payload():
+    """Snapshot and serialize the registered tools once; the tool set is fixed after registration"""
+    global _TOOLS, _TOOLS_CACHE_BYTES, _TOOLS_CACHE_ETAG
+
+    _TOOLS = await mcp.get_tools()
 
-        tools = []
-        for name, tool in tools_dict.items():
-            tool_info = {
-                "name": tool.name,
-                "description": tool.description or "No description"
-            }
+    tools = []
+    for name, tool in _TOOLS.items():
+        tool_info = {
+            "name": tool.name,
+            "description": tool.description or "No description"
+        }
 
-            # Include parameter schema for structured function calling
-            if hasattr(tool, 'parameters') and tool.parameters:
-                tool_info["parameters"] = tool.parameters
-            elif hasattr(tool, 'inputSchema') and tool.inputSchema:
-                tool_info["parameters"] = tool.inputSchema
+        # Include parameter schema for structured function calling
+        parameters = getattr(tool, 'parameters', None) or getattr(tool, 'inputSchema', None)
+        if parameters:
+            tool_info["parameters"] = parameters
 
-            # No truncation - LLM benefits from full descriptions
+        # No truncation - LLM benefits from full descriptions
+
+        tools.append(tool_info)
+
+    tool_count = len(tools)
+    _TOOLS_CACHE_BYTES = orjson.dumps({
+        "status": "ok",
+        "tool_count": tool_count,
+        "tools": tools,
+        "message": f"Found {tool_count} registered tools"
+    })
+    _TOOLS_CACHE_ETAG = f'"{hashlib.md5(_TOOLS_CACHE_BYTES, usedforsecurity=False).hexdigest()}"'
+    logger.info("Cached /debug/tools payload for %d tools", tool_count)
 
-            tools.append(tool_info)
+@mcp.custom_route("/debug/tools", methods=["GET"])
+async def list_tools(request: Request):
+    """List all registered MCP tools with full descriptions and parameter schemas"""
+    try:
+        if _TOOLS_CACHE_BYTES is None:
+            await build_tools_payload()
 
-        tool_count = len(tools)
-        logger.info(f"Successfully listed {tool_count} registered tools")
+        headers = {"etag": _TOOLS_CACHE_ETAG}
+        if request.headers.get("if-none-match") == _TOOLS_CACHE_ETAG:
+            return Response(status_code=304, headers=headers)
 
-        return JSONResponse({
-            "status": "ok",
-            "tool_count": tool_count,
-            "tools": tools,
-            "message": f"Found {tool_count} registered tools"
-        })
+        return Response(
+            content=_TOOLS_CACHE_BYTES,
+            media_type="application/json",
+            headers=headers,
+        )
 
     except Exception as e:
-        logger.error(f"Error listing tools: {e}", exc_info=True)
-        return JSONResponse({
+        logger.error("Error listing tools: %s", e, exc_info=True)
+        return ORJSONResponse({
             "status": "error",
             "message": str(e),
             "tool_count": 0,
             "tools": []
         }, status_code=500)
 
+# Only these request headers are echoed; credentials and cookies never leave the server
+_ECHO_HEADER_ALLOWLIST = frozenset({"content-type", "content-length", "user-agent", "accept", "x-request-id"})
+
 @mcp.custom_route("/debug/echo", methods=["POST"])
 async def echo_request(request: Request):
     """Echo back request details for debugging"""
     body = await request.body()
-    return JSONResponse({
+    # 500 chars need at most 2000 UTF-8 bytes; don't decode the whole payload
+    preview = body[:2000].decode('utf-8', errors='ignore')[:500] if body else ""
+    client = request.client
+    return ORJSONResponse({
         "method": request.method,
         "url": str(request.url),
-        "headers": dict(request.headers),
+        "headers": {k: v for k, v in request.headers.items() if k in _ECHO_HEADER_ALLOWLIST},
         "body_size": len(body),
-        "body_preview": body.decode('utf-8', errors='ignore')[:500],
-        "client": request.client.host if request.client else None
+        "body_preview": preview,
+        "client": client.host if client else None
     })
 
 @mcp.custom_route("/call_tool", methods=["POST"])
@@ -127,24 +194,26 @@ async def call_tool_http(request: Request):
         arguments = body.get("arguments", {})
 
         if not tool_name:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"status": "error", "message": "Missing tool_name"},
                 status_code=400,
             )
 
         if not isinstance(arguments, dict):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"status": "error", "message": "arguments must be a dict"},
                 status_code=400,
             )
 
-        logger.info(f"HTTP tool call: {tool_name} with args: {arguments}")
+        logger.info("HTTP tool call: %s with args: %s", tool_name, arguments)
 
         # 🔑 Get registered tools
-        tools = await mcp.get_tools()
+        if _TOOLS is None:
+            await build_tools_payload()
+        tools = _TOOLS
 
         if tool_name not in tools:
-            return JSONResponse(
+            return ORJSONResponse(
                 {
                     "status": "error",
                     "message": f"Tool '{tool_name}' not found",
@@ -155,21 +224,24 @@ async def call_tool_http(request: Request):
         tool = tools[tool_name]
 
         # 🔑 Call the tool function directly
+        start_ns = perf_counter_ns()
         result = await tool.fn(**arguments)
 
-        logger.info(f"Tool {tool_name} completed successfully")
+        logger.info("Tool %s completed successfully (%.2fms)", tool_name, (perf_counter_ns() - start_ns) / 1e6)
 
-        return JSONResponse(
-            {
-                "status": "success",
-                "tool_name": tool_name,
-                "result": result,
-            }
-        )
+        # Encode the result once and splice it into the envelope instead of wrapping it in another dict
+        content = b"".join((
+            b'{"status":"success","tool_name":',
+            orjson.dumps(tool_name),
+            b',"result":',
+            orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS),
+            b"}",
+        ))
+        return Response(content=content, media_type="application/json")
 
     except Exception as e:
         logger.error("Error calling tool via HTTP", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "status": "error",
                 "message": str(e),
@@ -178,15 +250,48 @@ async def call_tool_http(request: Request):
             status_code=500,
         )
 
+def http_app_factory():
+    """ASGI app for multi-worker uvicorn; every worker imports the server and runs its own lifespan"""
+    # Workers share no MCP session state, so each request has to stand on its own
+    return mcp.http_app(stateless_http=True)
+
+def install_uvloop():
+    """Use uvloop as the asyncio event loop policy when it is available."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
 def main():
     """Main entry point"""
-    transport = os.getenv("MCP_TRANSPORT", "stdio").lower()
-    port = int(os.getenv("PORT", "8080"))
+    settings = get_settings()
+    transport = settings.transport
+    port = settings.port
     
     if transport == "http":
         # Cloud Run deployment - use HTTP
-        logger.info(f"Starting HTTP server on 0.0.0.0:{port}")
-        mcp.run(transport="http", host="0.0.0.0", port=port)
+        # FastMCP drives uvicorn inside anyio.run(), which builds its loop from the policy
+        install_uvloop()
+        if settings.workers > 1:
+            import uvicorn
+
+            logger.info("Starting HTTP server on 0.0.0.0:%d with %d workers", port, settings.workers)
+            uvicorn.run(
+                "opendota_mcp.server:http_app_factory",
+                factory=True,
+                host="0.0.0.0",
+                port=port,
+                workers=settings.workers,
+                timeout_graceful_shutdown=0,
+            )
+        else:
+            logger.info("Starting HTTP server on 0.0.0.0:%d", port)
+            mcp.run(transport="http", host="0.0.0.0", port=port)
     else:
         # Local Claude Desktop - use stdio (default)
         logger.info("Starting in stdio mode for Claude Desktop")
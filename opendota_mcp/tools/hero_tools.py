@@ -54,7 +54,7 @@ def register_hero_tools(mcp: FastMCP):
             hero_id = await resolve_hero(hero)
             return await get_hero_by_id_logic(hero_id)
         except ValueError as e:
-            logger.error(f"Error resolving hero '{hero}': {e}")
+            logger.error("Error resolving hero '%s': %s", hero, e)
             return {"error": str(e)}
 
     @mcp.tool() #Have a look at this. Add hero limit etc.
@@ -133,7 +133,7 @@ def register_hero_tools(mcp: FastMCP):
 
             return structured_result
         except ValueError as e:
-            logger.error(f"Error resolving hero: {e}")
+            logger.error("Error resolving hero: %s", e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -212,15 +212,15 @@ def register_hero_tools(mcp: FastMCP):
             for game_phase, items in result.items():
                 phase_items = {}
                 for item_id, count in items.items():
-                    item_name = await get_item_display_name_by_id(item_id)
+                    item_name = get_item_display_name_by_id(item_id)
                     phase_items[item_name] = count
                 structured_result[game_phase] = phase_items
 
             return structured_result
         
         except ValueError as e:
-            logger.error(f"Error resolving hero: {e}")
+            logger.error("Error resolving hero: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Unexpected error in get_hero_item_popularity: {e}", exc_info=True)
+            logger.error("Unexpected error in get_hero_item_popularity: %s", e, exc_info=True)
             return {"error": f"Unexpected error: {str(e)}"}
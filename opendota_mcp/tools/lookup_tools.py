@@ -48,13 +48,13 @@ def register_lookup_tools(mcp: FastMCP):
             get_item_details("octarine") → Same result (fuzzy match)
         """
         try:
-            internal_name = await resolve_item_to_internal_name(item_name)
+            internal_name = resolve_item_to_internal_name(item_name)
 
-            response = await get_item_details_logic(internal_name)
+            response = get_item_details_logic(internal_name)
 
             return response
         except ValueError as e:
-            logger.error(f"Error resolving item '{item_name}': {e}")
+            logger.error("Error resolving item '%s': %s", item_name, e)
             return {"error": str(e)}
 
 
@@ -99,5 +99,5 @@ def register_lookup_tools(mcp: FastMCP):
             hero_id = await resolve_hero(hero)
             return get_aghs_details_logic(hero_id)
         except ValueError as e:
-            logger.error(f"Error resolving hero '{hero}': {e}")
+            logger.error("Error resolving hero '%s': %s", hero, e)
             return {"error": str(e)}
\ No newline at end of file
@@ -4,7 +4,7 @@ Match-related tools
 import logging
 from fastmcp import FastMCP
 from ..client import fetch_api, get_http_client, rate_limiter
-from ..config import OPENDOTA_BASE_URL, format_rank_tier
+from ..config import format_rank_tier
 from ..utils import get_account_id
 from typing import List, Dict, Any, Union
 from ..resolvers import get_hero_by_id_logic, extract_match_sections, process_player_items, build_player_list, build_teamfight_list
@@ -84,7 +84,7 @@ def register_match_tools(mcp: FastMCP):
         try:
             account_id = await get_account_id(player_name)
             result = await fetch_api(f"/players/{account_id}/recentMatches")
-            logger.info(f"Recent matches for '{player_name}' fetched successfully")
+            logger.info("Recent matches for '%s' fetched successfully", player_name)
 
             structured_result = [
                 {
@@ -109,7 +109,7 @@ def register_match_tools(mcp: FastMCP):
             return structured_result
 
         except Exception as e:
-            logger.error(f"Error getting recent matches for '{player_name}': {e}")
+            logger.error("Error getting recent matches for '%s': %s", player_name, e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -159,15 +159,15 @@ def register_match_tools(mcp: FastMCP):
             client = await get_http_client()
             await rate_limiter.acquire()
             
-            response = await client.post(f"{OPENDOTA_BASE_URL}/request/{match_id}")
+            response = await client.post(f"/request/{match_id}")
             response.raise_for_status()
             result = response.json()
             
-            logger.info(f"Successfully requested parse for match {match_id}")
+            logger.info("Successfully requested parse for match %s", match_id)
             
             return result
         except Exception as e:
-            logger.error(f"Failed to request parse for match {match_id}: {str(e)}")
+            logger.error("Failed to request parse for match %s: %s", match_id, e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -307,7 +307,7 @@ def register_match_tools(mcp: FastMCP):
                         'radiant_gold_adv' in response)
 
             if is_parsed:
-                logger.info(f"Match {match_id} is parsed, returning summarized data")
+                logger.info("Match %s is parsed, returning summarized data", match_id)
                 sections = await extract_match_sections(response)
 
                 raw_teamfights = response.get('teamfights', [])
@@ -339,12 +339,12 @@ def register_match_tools(mcp: FastMCP):
                 }
             else:
                 # Match is NOT parsed - return full data (it's small enough)
-                logger.info(f"Match {match_id} is not parsed, returning full data")
+                logger.info("Match %s is not parsed, returning full data", match_id)
 
                 # Build player list with item data
                 unparsed_players = []
                 for p in response.get("players", []):
-                    items_data = await process_player_items(p)
+                    items_data = process_player_items(p)
 
                     player_dict = {
                         "account_id": p.get("account_id"),
@@ -385,5 +385,5 @@ def register_match_tools(mcp: FastMCP):
                 }
 
         except Exception as e:
-            logger.error(f"Error getting match details for {match_id}: {e}")
+            logger.error("Error getting match details for %s: %s", match_id, e)
             return {"error": str(e)}
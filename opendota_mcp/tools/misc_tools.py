@@ -86,10 +86,10 @@ def register_misc_tools(mcp: FastMCP):
 
             return benchmark_results
         except ValueError as e:
-            logger.error(f"Error resolving hero: {e}")
+            logger.error("Error resolving hero: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -168,10 +168,10 @@ def register_misc_tools(mcp: FastMCP):
             ]
             return updated_response
         except ValueError as e:
-            logger.error(f"Error resolving field: {e}")
+            logger.error("Error resolving field: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             return {"error": str(e)}
 
     @mcp.tool() #Have a look athis. Might be too big of a response.
@@ -324,10 +324,10 @@ def register_misc_tools(mcp: FastMCP):
                 return result
             
         except ValueError as e:
-            logger.error(f"Error resolving parameter: {e}")
+            logger.error("Error resolving parameter: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -426,10 +426,10 @@ def register_misc_tools(mcp: FastMCP):
             return {"error": "Missing required parameters. Please either give a hero name or an item name"}
 
         try:
-            resolved_item_name = await resolve_item_to_internal_name(item_name)
-            logger.info(f"Resolved item name: {resolved_item_name}")
+            resolved_item_name = resolve_item_to_internal_name(item_name)
+            logger.info("Resolved item name: %s", resolved_item_name)
             hero_id = await resolve_hero(hero_name)
-            logger.info(f"Resolved hero name: {hero_id}")
+            logger.info("Resolved hero name: %s", hero_id)
 
             response = await fetch_api("/scenarios/itemTimings", {"hero_id": hero_id, "item": resolved_item_name})
             result = {} 
@@ -493,8 +493,8 @@ def register_misc_tools(mcp: FastMCP):
                 return result
             
         except ValueError as e:
-            logger.error(f"Error resolving parameter: {e}")
+            logger.error("Error resolving parameter: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             return {"error": str(e)}
\ No newline at end of file
@@ -65,7 +65,7 @@ def register_player_tools(mcp: FastMCP):
             player = Player(account_id=account_id)
 
             # Fetch all three API endpoints in parallel
-            logger.info(f"Fetching player data for account_id: {account_id}")
+            logger.info("Fetching player data for account_id: %s", account_id)
             profile_data, wl_data, heroes_data = await asyncio.gather(
                 fetch_api(f"/players/{account_id}"),
                 fetch_api(f"/players/{account_id}/wl"),
@@ -99,14 +99,14 @@ def register_player_tools(mcp: FastMCP):
                     "win_rate": round((win_count / games_played) * 100, 2) if games_played > 0 else 0.0
                 })
             
-            logger.info(f"Successfully retrieved complete info for {player_name}")
+            logger.info("Successfully retrieved complete info for %s", player_name)
             return player.to_dict()
             
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error for player '{player_name}': {e}")
+            logger.error("HTTP error for player '%s': %s", player_name, e)
             return {"error": f"API error: {e.response.status_code}"}
         except Exception as e:
-            logger.error(f"Error getting player info for '{player_name}': {e}")
+            logger.error("Error getting player info for '%s': %s", player_name, e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -203,10 +203,10 @@ def register_player_tools(mcp: FastMCP):
             return wl_data
             
         except ValueError as e:
-            logger.error(f"Error resolving parameter: {e}")
+            logger.error("Error resolving parameter: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error getting win/loss for '{player_name}': {e}")
+            logger.error("Error getting win/loss for '%s': %s", player_name, e)
             return {"error": str(e)}
 
     @mcp.tool() #Have a look at this. Limit hero etc.
@@ -316,10 +316,10 @@ def register_player_tools(mcp: FastMCP):
             return structured_result
             
         except ValueError as e:
-            logger.error(f"Error resolving parameter: {e}")
+            logger.error("Error resolving parameter: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error getting heroes played for '{player_name}': {e}")
+            logger.error("Error getting heroes played for '%s': %s", player_name, e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -431,10 +431,10 @@ def register_player_tools(mcp: FastMCP):
             
             return structured_result
         except ValueError as e:
-            logger.error(f"Error resolving parameter: {e}")
+            logger.error("Error resolving parameter: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error getting peers for '{player_name}': {e}")
+            logger.error("Error getting peers for '%s': %s", player_name, e)
             return {"error": str(e)}
 
     @mcp.tool() #Have a look at this. Response might be too big.
@@ -546,10 +546,10 @@ def register_player_tools(mcp: FastMCP):
             return structured_result
             
         except ValueError as e:
-            logger.error(f"Error resolving parameter: {e}")
+            logger.error("Error resolving parameter: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error getting totals for '{player_name}': {e}")
+            logger.error("Error getting totals for '%s': %s", player_name, e)
             return {"error": str(e)}
 
     @mcp.tool()
@@ -676,8 +676,8 @@ def register_player_tools(mcp: FastMCP):
             return structured_result
             
         except ValueError as e:
-            logger.error(f"Error resolving parameter: {e}")
+            logger.error("Error resolving parameter: %s", e)
             return {"error": str(e)}
         except Exception as e:
-            logger.error(f"Error getting histograms for '{player_name}': {e}")
+            logger.error("Error getting histograms for '%s': %s", player_name, e)
             return {"error": str(e)}
\ No newline at end of file
@@ -1,20 +1,39 @@
 """
 Utility functions for OpenDota MCP Server
 """
+import functools
 import json
 import logging
+import string
 from typing import Dict, Any, List
-from .config import PLAYER_CACHE, OPENDOTA_BASE_URL, REFERENCE_DATA
+from .config import PLAYER_CACHE_NORM, REFERENCE_DATA, REFERENCE_FILES, player_cache_key
 from .client import get_http_client, rate_limiter
 
 logger = logging.getLogger("opendota-server")
 
 
+# Deletes spaces, hyphens and apostrophes in a single pass
+_NORM_TABLE = str.maketrans("", "", " -'")
+# Same, with ASCII lowercasing folded in (only valid for ASCII input)
+_ASCII_NORM_TABLE = str.maketrans({
+    **{c: None for c in " -'"},
+    **{c: c.lower() for c in string.ascii_uppercase},
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_name(name: str) -> str:
+    """Remove spaces, hyphens, apostrophes, make lowercase"""
+    if name.isascii():
+        return name.translate(_ASCII_NORM_TABLE)
+    return name.lower().translate(_NORM_TABLE)
+
+
 async def get_account_id(player_name: str) -> str:
     """
     Get account_id for a player, using static cache if available.
 
-    Checks the pre-populated PLAYER_CACHE first for known players.
+    Checks the pre-populated PLAYER_CACHE (case- and whitespace-insensitive) first for known players.
     If not found, searches via OpenDota API (does not cache results).
 
     Args:
@@ -26,17 +45,16 @@ async def get_account_id(player_name: str) -> str:
     Raises:
         ValueError: If player not found
     """
-    player_name_lower = player_name.lower()
-
     # Check static cache first
-    if player_name_lower in PLAYER_CACHE:
-        return PLAYER_CACHE[player_name_lower]
+    account_id = PLAYER_CACHE_NORM.get(player_cache_key(player_name))
+    if account_id is not None:
+        return account_id
 
     # Search via API (not cached)
     client = await get_http_client()
     await rate_limiter.acquire()
 
-    search_response = await client.get(f"{OPENDOTA_BASE_URL}/search?q={player_name}")
+    search_response = await client.get("/search", params={"q": player_name})
     search_response.raise_for_status()
 
     search_results = search_response.json()
@@ -53,7 +71,7 @@ def load_json(filepath: str) -> Dict[str, Any]:
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
     except (FileNotFoundError, json.JSONDecodeError, IOError) as e:
-        logger.error(f"Error loading {filepath}: {e}")
+        logger.error("Error loading %s: %s", filepath, e)
         return {}
 
 
@@ -64,20 +82,61 @@ def load_reference_data():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     constants_dir = os.path.join(current_dir, 'constants')
     
-    logger.info(f"Loading reference data from: {constants_dir}")
+    logger.info("Loading reference data from: %s", constants_dir)
 
-    for const in REFERENCE_DATA.keys():
+    for const in REFERENCE_FILES:
         filepath = os.path.join(constants_dir, f"{const}.json")
         if os.path.exists(filepath):
             data = load_json(filepath)
             if data:
                 REFERENCE_DATA[const] = data
-                logger.info(f"Loaded {const}.json successfully ({len(data)} entries)")
+                logger.info("Loaded %s.json successfully (%d entries)", const, len(data))
             else:
-                logger.warning(f"Failed to load or empty: {filepath}")
+                logger.warning("Failed to load or empty: %s", filepath)
                 REFERENCE_DATA[const] = {}
         else:
-            logger.warning(f"File not found: {filepath}")
+            logger.warning("File not found: %s", filepath)
             REFERENCE_DATA[const] = {}
 
-    logger.info(f"Reference data loaded: {list(REFERENCE_DATA.keys())}")
\ No newline at end of file
+    build_reference_indexes()
+
+    logger.info("Reference data loaded: %s", list(REFERENCE_FILES))
+
+
+def build_reference_indexes():
+    """Build lookup indexes derived from the loaded reference data."""
+    heroes_by_norm = {
+        normalize_name(hero['localized_name']): hero
+        for hero in REFERENCE_DATA["heroes"].values()
+    }
+    REFERENCE_DATA["heroes_by_norm"] = heroes_by_norm
+    REFERENCE_DATA["hero_names"] = tuple(heroes_by_norm)
+    REFERENCE_DATA["heroes_list"] = tuple(heroes_by_norm.values())
+    REFERENCE_DATA["hero_names_sorted"] = tuple(sorted(heroes_by_norm))
+    logger.info("Built hero name index (%d entries)", len(REFERENCE_DATA['heroes_by_norm']))
+
+    items = REFERENCE_DATA["items"]
+    item_names = tuple(items)
+    item_names_norm = tuple(normalize_name(internal_name) for internal_name in item_names)
+    item_dnames_norm = tuple(normalize_name(item_data.get('dname', '')) for item_data in items.values())
+    items_by_norm_name: Dict[str, str] = {}
+    items_by_norm_dname: Dict[str, str] = {}
+    for internal_name, name_norm, dname_norm in zip(item_names, item_names_norm, item_dnames_norm):
+        items_by_norm_name.setdefault(name_norm, internal_name)
+        items_by_norm_dname.setdefault(dname_norm, internal_name)
+    REFERENCE_DATA["item_names"] = item_names
+    REFERENCE_DATA["item_names_norm"] = item_names_norm
+    REFERENCE_DATA["item_dnames_norm"] = item_dnames_norm
+    REFERENCE_DATA["items_by_norm_name"] = items_by_norm_name
+    REFERENCE_DATA["items_by_norm_dname"] = items_by_norm_dname
+    REFERENCE_DATA["item_costs"] = {
+        internal_name: item_data.get('cost') or 0
+        for internal_name, item_data in items.items()
+    }
+    logger.info("Built item name index (%d entries)", len(item_names))
+
+    # aghs_desc is an array; index it by hero_id
+    aghs_by_hero_id: Dict[int, Dict[str, Any]] = {}
+    for hero_aghs in REFERENCE_DATA["aghs_desc"] or ():
+        aghs_by_hero_id.setdefault(hero_aghs.get('hero_id'), hero_aghs)
+    REFERENCE_DATA["aghs_by_hero_id"] = aghs_by_hero_id
\ No newline at end of file
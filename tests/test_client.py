@@ -0,0 +1,141 @@
+"""
+Tests for the fetch_api response cache
+"""
+import asyncio
+
+import orjson
+
+from opendota_mcp import client
+
+
+def _fake_upstream(monkeypatch):
+    """Serve fetch_api from a stub upstream with an empty cache, recording requested endpoints"""
+    calls = []
+
+    async def fake_request_body(endpoint, params):
+        calls.append(endpoint)
+        return orjson.dumps({"endpoint": endpoint, "players": [{"hero_id": 1}]})
+
+    monkeypatch.setattr(client, "_request_body", fake_request_body)
+    monkeypatch.setattr(client, "_response_cache", {})
+    monkeypatch.setattr(client, "_response_cache_bytes", 0)
+    return calls
+
+
+def test_expired_entry_is_dropped_on_lookup(monkeypatch):
+    calls = _fake_upstream(monkeypatch)
+    asyncio.run(client.fetch_api("/heroes"))
+
+    key = client._cache_key("/heroes", {})
+    expiry, body = client._response_cache[key]
+    client._response_cache[key] = (expiry - 10_000, body)
+
+    assert client._cache_get(key) is None
+    assert key not in client._response_cache
+    assert client._response_cache_bytes == 0
+    assert calls == ["/heroes"]
+
+
+def test_store_purges_expired_entries(monkeypatch):
+    _fake_upstream(monkeypatch)
+
+    async def run():
+        for account_id in range(10):
+            await client.fetch_api(f"/players/{account_id}")
+        for key, (expiry, body) in list(client._response_cache.items()):
+            client._response_cache[key] = (expiry - 10_000, body)
+        await client.fetch_api("/heroes")
+
+    asyncio.run(run())
+
+    assert list(client._response_cache) == [client._cache_key("/heroes", {})]
+    assert client._response_cache_bytes == len(client._response_cache[client._cache_key("/heroes", {})][1])
+
+
+def test_matches_are_bounded_separately(monkeypatch):
+    _fake_upstream(monkeypatch)
+
+    async def run():
+        for match_id in range(300):
+            await client.fetch_api(f"/matches/{match_id}")
+
+    asyncio.run(run())
+
+    limit = client.RESPONSE_CACHE_PREFIX_MAX_ENTRIES["/matches"]
+    assert len(client._response_cache) == limit
+    # The most recent matches are the ones kept
+    assert client._cache_key("/matches/299", {}) in client._response_cache
+
+
+def test_callers_cannot_mutate_cached_data(monkeypatch):
+    calls = _fake_upstream(monkeypatch)
+
+    async def run():
+        first = await client.fetch_api("/matches/1")
+        first["players"][0]["hero_id"] = 99
+        first["players"].append({"hero_id": 2})
+        return await client.fetch_api("/matches/1")
+
+    second = asyncio.run(run())
+
+    assert second["players"] == [{"hero_id": 1}]
+    assert calls == ["/matches/1"]
+
+
+def test_joiner_survives_leader_cancellation(monkeypatch):
+    started = None
+    release = None
+    calls = []
+
+    async def slow_request_body(endpoint, params):
+        calls.append(endpoint)
+        started.set()
+        await release.wait()
+        return orjson.dumps({"match_id": 1})
+
+    monkeypatch.setattr(client, "_request_body", slow_request_body)
+    monkeypatch.setattr(client, "_response_cache", {})
+    monkeypatch.setattr(client, "_response_cache_bytes", 0)
+
+    async def run():
+        nonlocal started, release
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        leader = asyncio.create_task(client.fetch_api("/matches/1"))
+        await started.wait()
+        joiner = asyncio.create_task(client.fetch_api("/matches/1"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        result = await joiner
+        assert leader.cancelled()
+        return result
+
+    assert asyncio.run(run()) == {"match_id": 1}
+    assert calls == ["/matches/1"]
+    assert client._cache_key("/matches/1", {}) in client._response_cache
+    assert not client._inflight
+
+
+def test_leader_and_joiner_each_decode_once(monkeypatch):
+    _fake_upstream(monkeypatch)
+    decodes = []
+
+    def counting_loads(body):
+        decodes.append(body)
+        return orjson.loads(body)
+
+    monkeypatch.setattr(client, "_json_loads", counting_loads)
+
+    async def run():
+        return await asyncio.gather(client.fetch_api("/matches/1"), client.fetch_api("/matches/1"))
+
+    leader_data, joiner_data = asyncio.run(run())
+
+    assert leader_data == joiner_data
+    assert leader_data is not joiner_data
+    assert len(decodes) == 2
@@ -0,0 +1,40 @@
+"""
+Tests for the OpenDota rate limiter
+"""
+import asyncio
+
+from opendota_mcp.classes import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only moves when the limiter sleeps"""
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        # Never stall on sub-ulp waits
+        self.now += max(seconds, 1e-6)
+        await asyncio.sleep(0)
+
+
+def test_first_minute_never_exceeds_requests_per_minute():
+    clock = FakeClock()
+
+    async def run():
+        limiter = RateLimiter(requests_per_minute=50, clock=clock.monotonic, sleep=clock.sleep)
+        start = clock.now
+        admitted = []
+        while clock.now - start < 120 and len(admitted) < 1000:
+            await limiter.acquire()
+            admitted.append(clock.now - start)
+        return admitted
+
+    admitted = asyncio.run(run())
+
+    assert sum(1 for t in admitted if t < 60) == 50
+    # Every rolling 60 s window holds at most requests_per_minute calls
+    for i, t in enumerate(admitted):
+        assert sum(1 for u in admitted[i:] if u - t < 60) <= 50
@@ -0,0 +1,34 @@
+"""
+Tests for hero name resolution
+"""
+import pytest
+
+from opendota_mcp.resolvers import get_hero_id_by_name_cached
+from opendota_mcp.utils import load_reference_data
+
+
+@pytest.fixture(scope="module", autouse=True)
+def reference_data():
+    load_reference_data()
+
+
+def test_unique_prefix_is_labelled_prefix():
+    result = get_hero_id_by_name_cached("anti")
+    assert result["localized_name"] == "Anti-Mage"
+    assert result["match_type"] == "prefix"
+
+
+def test_mid_name_query_is_labelled_substring():
+    result = get_hero_id_by_name_cached("runner")
+    assert result["localized_name"] == "Centaur Warrunner"
+    assert result["match_type"] == "substring"
+
+
+def test_cached_result_lists_are_not_shared():
+    first = get_hero_id_by_name_cached("zzzqqq")
+    assert "suggestions" in first
+    expected = list(first["suggestions"])
+    first["suggestions"].append("Corrupted")
+
+    second = get_hero_id_by_name_cached("zzzqqq")
+    assert second["suggestions"] == expected